@@ -0,0 +1,57 @@
+"""Advent of Code 2015 - Day 1 (benchmark)."""
+
+import os
+import re
+import tempfile
+import time
+from pathlib import Path
+
+import numpy
+
+from main import floor_and_basement, steps_to_basement
+
+
+def floor_and_basement_from_text(path):
+    """Determine final floor and basement step from the whole text."""
+    instructions = re.sub(r'[^()]', '', Path(path).read_text())
+    floor = instructions.count('(') - instructions.count(')')
+    return floor, steps_to_basement(instructions)
+
+
+def measure(label, function, *args, **kwargs):
+    """Time a function and report its result."""
+    start = time.perf_counter()
+    result = function(*args, **kwargs)
+    elapsed = time.perf_counter() - start
+
+    print('  {:<16} {:>24} {:>8.3f} s'.format(label, '{}/{}'.format(*result),
+                                              elapsed))
+
+
+def main():
+    """Compare the character loop against chunked floor tracking."""
+    NUM_INSTRUCTIONS = 1 << 28
+
+    # Drift upwards first, so the basement is only reached late in the file.
+    rng = numpy.random.RandomState(2015)
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / 'instructions.txt'
+        with path.open('wb') as file:
+            file.write(b'(' * 10000)
+            block_size = 1 << 20
+            for index in range(NUM_INSTRUCTIONS // block_size):
+                up = 0.501 if index < 128 else 0.498
+                block = numpy.where(rng.random_sample(block_size) < up,
+                                    ord('('), ord(')')).astype(numpy.uint8)
+                file.write(block.tobytes())
+
+        print('{} instructions:'.format(NUM_INSTRUCTIONS))
+        measure('character loop', floor_and_basement_from_text, path)
+        measure('chunked', floor_and_basement, path)
+        processes = os.cpu_count() or 1
+        measure('pool ({})'.format(processes), floor_and_basement, path,
+                processes=processes)
+
+
+if __name__ == '__main__':
+    main()
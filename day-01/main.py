@@ -1,12 +1,25 @@
 """Advent of Code 2015 - Day 1."""
 
+import mmap
+import multiprocessing
+import os
 import re
 from pathlib import Path
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def input_path():
+    """Determine path of input file."""
+    return Path(__file__).with_name('input.txt')
+
 
 def read_input():
     """Read input file, return string, and drop unexpected characters."""
-    text = Path(__file__).with_name('input.txt').read_text()
+    text = input_path().read_text()
     return re.sub(r'[^()]', '', text)
 
 
@@ -23,6 +36,72 @@ def steps_to_basement(instructions):
     raise RuntimeError('Failed to reach basement.')
 
 
+def read_steps(path, start, stop):
+    """Read a range of a file as an array of floor changes (+1, -1, or 0)."""
+    with open(str(path), 'rb') as file, \
+            mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        chunk = numpy.frombuffer(data[start:stop], dtype=numpy.uint8)
+
+    steps = numpy.zeros(len(chunk), dtype=numpy.int8)
+    steps[chunk == ord('(')] = 1
+    steps[chunk == ord(')')] = -1
+    return steps
+
+
+def summarize_range(path, start, stop):
+    """Summarize a range of a file by floor change and lowest floor.
+
+    Floors are relative to the start of the range. The number of actual
+    instructions is included, as the range may contain other characters.
+    """
+    steps = read_steps(path, start, stop)
+    floors = numpy.cumsum(steps, dtype=numpy.int32)
+    if not len(floors):
+        return 0, 0, 0
+    return (int(floors[-1]), int(floors.min()),
+            int(numpy.count_nonzero(steps)))
+
+
+def steps_to_floor_in_range(path, start, stop, floor, target):
+    """Determine number of instructions in a range to reach a given floor."""
+    steps = read_steps(path, start, stop)
+    floors = floor + numpy.cumsum(steps, dtype=numpy.int32)
+    index = int(numpy.argmax(floors == target))
+    return int(numpy.count_nonzero(steps[:index + 1]))
+
+
+def floor_and_basement(path, processes=1, chunk_size=1 << 22):
+    """Determine final floor and steps to the basement for a (large) file.
+
+    Every chunk of the file is summarized independently, by a pool of worker
+    processes unless a single process is requested. The running floor then
+    locates the first chunk that dips into the basement, which is the only
+    chunk that needs to be scanned again to find the exact step.
+    """
+    size = os.path.getsize(str(path))
+    chunks = [(path, start, min(start + chunk_size, size))
+              for start in range(0, size, chunk_size)]
+
+    if processes == 1:
+        summaries = [summarize_range(*chunk) for chunk in chunks]
+    else:
+        with multiprocessing.Pool(processes) as pool:
+            summaries = pool.starmap(summarize_range, chunks)
+
+    floor = 0
+    steps = 0
+    basement = None
+    for chunk, (delta, lowest, num_steps) in zip(chunks, summaries):
+        if basement is None and floor + lowest <= -1:
+            basement = steps + steps_to_floor_in_range(*chunk, floor, -1)
+        floor += delta
+        steps += num_steps
+
+    if basement is None:
+        raise RuntimeError('Failed to reach basement.')
+    return floor, basement
+
+
 def main():
     """Main entry point of puzzle solution."""
     instructions = read_input()
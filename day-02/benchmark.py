@@ -0,0 +1,53 @@
+"""Advent of Code 2015 - Day 2 (benchmark)."""
+
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from main import bulk_paper_and_ribbon, one_paper, one_ribbon
+
+
+def paper_and_ribbon_by_line(path):
+    """Compute needed wrapping paper and ribbon line by line."""
+    paper = 0
+    ribbon = 0
+    with open(str(path)) as file:
+        for line in file:
+            dims = sorted(map(int, line.split('x')))
+            paper += one_paper(*dims)
+            ribbon += one_ribbon(*dims)
+
+    return paper, ribbon
+
+
+def measure(label, function, path):
+    """Time a function and report its result."""
+    start = time.perf_counter()
+    result = function(path)
+    elapsed = time.perf_counter() - start
+
+    print('  {:<10} {:>28} {:>8.3f} s'.format(
+        label, '{}/{}'.format(*result), elapsed))
+
+
+def main():
+    """Compare the per-line loop against bulk parsing."""
+    NUM_PRESENTS = 5 * 10 ** 6
+
+    rng = random.Random(2015)
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / 'presents.txt'
+        with path.open('w') as file:
+            for _ in range(NUM_PRESENTS):
+                file.write('{}x{}x{}\n'.format(rng.randrange(1, 31),
+                                               rng.randrange(1, 31),
+                                               rng.randrange(1, 31)))
+
+        print('{} presents:'.format(NUM_PRESENTS))
+        measure('by line', paper_and_ribbon_by_line, path)
+        measure('bulk', bulk_paper_and_ribbon, path)
+
+
+if __name__ == '__main__':
+    main()
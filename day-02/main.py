@@ -2,10 +2,20 @@
 
 from pathlib import Path
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def input_path():
+    """Determine path of input file."""
+    return Path(__file__).with_name('input.txt')
+
 
 def read_input():
     """Read input file and split into individual lines returned as a list."""
-    return Path(__file__).with_name('input.txt').read_text().splitlines()
+    return input_path().read_text().splitlines()
 
 
 def one_paper(l, w, h):
@@ -26,6 +36,61 @@ def one_ribbon(l, w, h):
     return 2 * (l + w) + l * w * h
 
 
+def parse_dimensions(chunk):
+    """Parse a chunk of lines like 2x3x4 into an (N, 3) integer array.
+
+    Digits of all numbers are accumulated at once, one decimal place at a
+    time (Horner's method), so only as many passes are needed as the longest
+    number has digits.
+    """
+    data = numpy.frombuffer(chunk, dtype=numpy.uint8)
+    is_digit = numpy.zeros(len(data) + 2, dtype=numpy.int8)
+    numpy.less(data - numpy.uint8(ord('0')), 10, out=is_digit[1:-1],
+               casting='unsafe')
+
+    edges = numpy.diff(is_digit)
+    starts = numpy.flatnonzero(edges == 1)
+    lengths = numpy.flatnonzero(edges == -1) - starts
+
+    values = numpy.zeros(len(starts), dtype=numpy.int64)
+    for place in range(int(lengths.max()) if len(lengths) else 0):
+        positions = numpy.minimum(starts + place, len(data) - 1)
+        digits = data[positions] - ord('0')
+        values = numpy.where(lengths > place, values * 10 + digits, values)
+
+    return values.reshape(-1, 3)
+
+
+def bulk_paper_and_ribbon(path, chunk_size=1 << 24):
+    """Compute needed wrapping paper and ribbon for a file of presents.
+
+    The file is read in chunks of (roughly) fixed size ending at line
+    breaks. Per chunk, dimensions are parsed into an array and needed paper
+    and ribbon are computed for all presents at once. Instead of sorting
+    the dimensions of every present, the longest one is divided out.
+    """
+    paper = 0
+    ribbon = 0
+
+    def add_presents(chunk):
+        """Add needed wrapping paper and ribbon for a chunk of presents."""
+        nonlocal paper, ribbon
+        l, w, h = parse_dimensions(chunk).T
+        longest = numpy.maximum(numpy.maximum(l, w), h)
+        volume = l * w * h
+        paper += int((2 * (l * w + l * h + w * h) + volume // longest).sum())
+        ribbon += int((2 * (l + w + h - longest) + volume).sum())
+
+    with open(str(path), 'rb') as file:
+        leftover = b''
+        for block in iter(lambda: file.read(chunk_size), b''):
+            chunk, _, leftover = (leftover + block).rpartition(b'\n')
+            add_presents(chunk)
+        add_presents(leftover)
+
+    return paper, ribbon
+
+
 def main():
     """Main entry point of puzzle solution."""
     lines = read_input()
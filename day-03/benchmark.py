@@ -0,0 +1,55 @@
+"""Advent of Code 2015 - Day 3 (benchmark)."""
+
+import random
+import time
+
+from main import count_visited_houses, walk, walk_with_robo_santa
+
+
+def measure(label, function, *args):
+    """Time a function and report its result."""
+    start = time.perf_counter()
+    result = function(*args)
+    elapsed = time.perf_counter() - start
+
+    print('  {:<16} {:>12} {:>8.3f} s'.format(label, result, elapsed))
+
+
+def main():
+    """Compare walking with sets of tuples against packed arrays."""
+    NUM_MOVES = 10 ** 7
+
+    rng = random.Random(2015)
+    data = bytes(rng.choice(b'<>^v') for _ in range(NUM_MOVES))
+    print('{} moves:'.format(NUM_MOVES))
+
+    def walk_alone():
+        """Walk alone using a set of tuples."""
+        item_to_offset = {
+            ord('<'): (-1, 0),
+            ord('>'): (+1, 0),
+            ord('^'): (0, -1),
+            ord('v'): (0, +1),
+        }
+        return len(walk([item_to_offset[item] for item in data]))
+
+    def walk_in_pairs():
+        """Walk with Robo-Santa using sets of tuples."""
+        item_to_offset = {
+            ord('<'): (-1, 0),
+            ord('>'): (+1, 0),
+            ord('^'): (0, -1),
+            ord('v'): (0, +1),
+        }
+        return len(walk_with_robo_santa([item_to_offset[item]
+                                         for item in data]))
+
+    measure('set (1 Santa)', walk_alone)
+    measure('set (2 Santas)', walk_in_pairs)
+    for num_santas in [1, 2, 10]:
+        measure('packed (n={})'.format(num_santas),
+                count_visited_houses, data, num_santas)
+
+
+if __name__ == '__main__':
+    main()
@@ -3,6 +3,11 @@
 import re
 from pathlib import Path
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 
 def read_input():
     """Read input file, return string, and drop unexpected characters."""
@@ -43,6 +48,61 @@ def walk_with_robo_santa(instructions):
     return walk(instructions_real_santa) | walk(instructions_robo_santa)
 
 
+def count_visited_houses(data, num_santas=1, chunk_size=1 << 22):
+    """Count houses visited by Santas taking turns on the instructions.
+
+    The instructions (any bytes-like object, e.g. a memory-mapped file) are
+    processed in chunks. Per chunk, characters are mapped to step arrays,
+    cumulative sums yield the positions of every Santa, and positions are
+    packed into single integers. Visited houses are kept as a sorted array
+    of distinct packed positions that is merged with every chunk.
+    """
+    steps_x = numpy.zeros(256, dtype=numpy.int64)
+    steps_y = numpy.zeros(256, dtype=numpy.int64)
+    is_step = numpy.zeros(256, dtype=bool)
+    for item, x_step, y_step in [(b'<', -1, 0), (b'>', +1, 0),
+                                 (b'^', 0, -1), (b'v', 0, +1)]:
+        steps_x[ord(item)] = x_step
+        steps_y[ord(item)] = y_step
+        is_step[ord(item)] = True
+
+    def pack(x, y):
+        """Pack pairs of coordinates into single integers."""
+        return (x << 32) + y
+
+    def merge(visited, keys):
+        """Merge packed positions into a sorted array of distinct ones."""
+        keys = numpy.sort(numpy.concatenate([visited, keys.ravel()]))
+        return keys[numpy.concatenate([[True], keys[1:] != keys[:-1]])]
+
+    x = numpy.zeros(num_santas, dtype=numpy.int64)
+    y = numpy.zeros(num_santas, dtype=numpy.int64)
+    visited = pack(x[:1], y[:1])
+
+    data = numpy.frombuffer(data, dtype=numpy.uint8)
+    leftover = data[:0]
+    for start in range(0, len(data) + chunk_size, chunk_size):
+        chunk = data[start:start + chunk_size]
+        items = numpy.concatenate([leftover, chunk[is_step[chunk]]])
+
+        # Pad the final chunk (without moving) to give all Santas a turn.
+        if not len(chunk):
+            items = numpy.append(items, numpy.zeros(-len(items) % num_santas,
+                                                    dtype=numpy.uint8))
+        num_turns = len(items) - len(items) % num_santas
+        items, leftover = items[:num_turns], items[num_turns:]
+
+        trail_x = x + numpy.cumsum(steps_x[items].reshape(-1, num_santas),
+                                   axis=0)
+        trail_y = y + numpy.cumsum(steps_y[items].reshape(-1, num_santas),
+                                   axis=0)
+        if len(trail_x):
+            x, y = trail_x[-1], trail_y[-1]
+            visited = merge(visited, pack(trail_x, trail_y))
+
+    return len(visited)
+
+
 def main():
     """Main entry point of puzzle solution."""
     instructions = read_instructions()
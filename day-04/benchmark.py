@@ -0,0 +1,34 @@
+"""Advent of Code 2015 - Day 4 (benchmark)."""
+
+import os
+import time
+
+from main import md5_with_prefix, md5_with_prefix_parallel
+
+
+def measure(label, search, *args, **kwargs):
+    """Time a search and report its throughput in hashes per second."""
+    start = time.perf_counter()
+    number = search(*args, **kwargs)
+    elapsed = time.perf_counter() - start
+
+    print('{:<16} {:>10} {:>8.2f} s {:>12,.0f} hashes/s'.format(
+        label, number, elapsed, (number + 1) / elapsed))
+
+
+def main():
+    """Compare the serial search against the sharded parallel search."""
+    INPUT_KEY = b'ckczppom'
+    PREFIX = '0' * 6
+
+    measure('serial', md5_with_prefix, INPUT_KEY, PREFIX)
+
+    processes = 1
+    while processes <= (os.cpu_count() or 1):
+        measure('parallel ({})'.format(processes), md5_with_prefix_parallel,
+                INPUT_KEY, PREFIX, processes=processes)
+        processes *= 2
+
+
+if __name__ == '__main__':
+    main()
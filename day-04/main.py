@@ -1,7 +1,12 @@
 """Advent of Code 2015 - Day 4."""
 
+import collections
 import hashlib
 import itertools
+import json
+import multiprocessing
+import os
+from pathlib import Path
 
 
 def md5_with_prefix(input, prefix, start_with=0):
@@ -15,12 +20,191 @@ def md5_with_prefix(input, prefix, start_with=0):
             return number
 
 
+def digest_matcher(prefix):
+    """Build a predicate that checks a raw digest against a hex prefix.
+
+    Full bytes of the prefix are compared as a bytes slice, while a trailing
+    odd nibble (if any) is compared against the high nibble of the next byte.
+    """
+    full_bytes = bytes.fromhex(prefix[:len(prefix) & ~1])
+    num_bytes = len(full_bytes)
+
+    if len(prefix) % 2 == 0:
+        return lambda digest: digest[:num_bytes] == full_bytes
+
+    nibble = int(prefix[-1], 16)
+    return lambda digest: (digest[:num_bytes] == full_bytes and
+                           digest[num_bytes] >> 4 == nibble)
+
+
+def md5_with_prefix_in_range(input, prefix, start, stop):
+    """Determine first number in a range that generates a matching hash."""
+    md5_input = hashlib.md5(input)
+    matches = digest_matcher(prefix)
+
+    for number in range(start, stop):
+        md5 = md5_input.copy()
+        md5.update(str(number).encode('ascii'))
+        if matches(md5.digest()):
+            return number
+
+    return None
+
+
+def md5_with_prefix_parallel(input, prefix, start_with=0, chunk_size=50000,
+                             processes=None):
+    """Determine first number with a matching hash using a process pool.
+
+    The number space is split into consecutive chunks that are searched by
+    the pool. Results are consumed in chunk order, such that the first chunk
+    that yields a number also yields the smallest matching number overall.
+    """
+    if processes is None:
+        processes = os.cpu_count() or 1
+
+    # Keep a few chunks per worker in flight to avoid idle processes.
+    in_flight = 2 * processes
+
+    with multiprocessing.Pool(processes) as pool:
+        chunk_starts = itertools.count(start_with, chunk_size)
+        pending = collections.deque()
+
+        while True:
+            while len(pending) < in_flight:
+                start = next(chunk_starts)
+                args = (input, prefix, start, start + chunk_size)
+                pending.append(pool.apply_async(md5_with_prefix_in_range,
+                                                args))
+
+            number = pending.popleft().get()
+            if number is not None:
+                return number
+
+
+class PrefixSearch:
+    """Resumable single-pass search for hashes with any of several prefixes.
+
+    The decimal suffix is assembled from a per-block ASCII head and a table
+    of ASCII tails instead of formatting every number, and the search state
+    can be checkpointed to (and resumed from) a JSON file on disk.
+    """
+
+    # Zero-padded trailing three digits shared by all blocks of numbers.
+    _TAILS = ['{:03}'.format(tail).encode('ascii') for tail in range(1000)]
+
+    @classmethod
+    def load(cls, path):
+        """Resume a search from a checkpoint file."""
+        state = json.loads(Path(path).read_text())
+        return cls(bytes.fromhex(state['input']), state['prefixes'],
+                   start_with=state['number'], found=state['found'])
+
+    def __init__(self, input, prefixes, start_with=0, found=None):
+        """Initialize a search for the given input and list of prefixes."""
+        self.input = input
+        self.prefixes = list(prefixes)
+        self.number = start_with
+        self.found = dict(found or {})
+
+    def save(self, path):
+        """Atomically write the current search state to a checkpoint file."""
+        state = {
+            'input': self.input.hex(),
+            'prefixes': self.prefixes,
+            'number': self.number,
+            'found': self.found,
+        }
+        temp_path = Path(path).with_suffix('.tmp')
+        temp_path.write_text(json.dumps(state))
+        os.replace(str(temp_path), str(path))
+
+    def finished(self):
+        """Check if a matching number has been found for every prefix."""
+        return all(prefix in self.found for prefix in self.prefixes)
+
+    def run(self, checkpoint=None, checkpoint_every=1000000):
+        """Search until all prefixes are matched, return numbers by prefix.
+
+        If a checkpoint path is given, the state is saved periodically and
+        also when the search is interrupted from the keyboard.
+        """
+        try:
+            while not self.finished():
+                self._scan(self.number + checkpoint_every)
+                if checkpoint is not None:
+                    self.save(checkpoint)
+        except KeyboardInterrupt:
+            if checkpoint is not None:
+                self.save(checkpoint)
+            raise
+
+        return dict(self.found)
+
+    def _scan(self, stop):
+        """Scan numbers up to the given stop for not yet matched prefixes.
+
+        Numbers are processed in blocks that share all but the last three
+        decimal digits, so the hash state for the leading digits is updated
+        only once per block and the trailing digits come from a fixed table.
+        """
+        md5_input = hashlib.md5(self.input)
+        pending = [prefix for prefix in self.prefixes
+                   if prefix not in self.found]
+
+        while pending and self.number < stop:
+            number = self.number
+            if number < 1000:
+                head = md5_input
+                tails = [str(tail).encode('ascii')
+                         for tail in range(number, 1000)]
+            else:
+                head = md5_input.copy()
+                head.update(str(number // 1000).encode('ascii'))
+                tails = self._TAILS[number % 1000:]
+
+            # Reject most digests using the prefix shared by all candidates.
+            candidates = os.path.commonprefix(pending)
+            maybe_matches = digest_matcher(candidates)
+            matchers = [(prefix, digest_matcher(prefix)) for prefix in pending]
+
+            for offset, tail in enumerate(tails):
+                md5 = head.copy()
+                md5.update(tail)
+                digest = md5.digest()
+                if not maybe_matches(digest):
+                    continue
+                for prefix, matches in matchers:
+                    if prefix not in self.found and matches(digest):
+                        self.found[prefix] = number + offset
+
+            self.number = number + len(tails)
+            pending = [prefix for prefix in pending
+                       if prefix not in self.found]
+
+
+def md5_with_prefixes(input, prefixes, start_with=0, checkpoint=None):
+    """Determine first numbers that generate hashes with the given prefixes.
+
+    All prefixes are matched in a single scan. If a checkpoint file exists,
+    the search is resumed from there instead of starting over, provided it
+    was saved for the same input and prefixes.
+    """
+    if checkpoint is not None and Path(checkpoint).exists():
+        search = PrefixSearch.load(checkpoint)
+        if search.input != input or search.prefixes != list(prefixes):
+            raise ValueError('Checkpoint does not match input and prefixes.')
+    else:
+        search = PrefixSearch(input, prefixes, start_with=start_with)
+
+    found = search.run(checkpoint=checkpoint)
+    return [found[prefix] for prefix in prefixes]
+
+
 def main():
     """Main entry point of puzzle solution."""
     INPUT_KEY = b'ckczppom'
 
-    magic_one = md5_with_prefix(INPUT_KEY, '0' * 5)
-    magic_two = md5_with_prefix(INPUT_KEY, '0' * 6, start_with=magic_one)
+    magic_one, magic_two = md5_with_prefixes(INPUT_KEY, ['0' * 5, '0' * 6])
 
     print('Part One: {}'.format(magic_one))
     print('Part Two: {}'.format(magic_two))
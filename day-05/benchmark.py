@@ -0,0 +1,65 @@
+"""Advent of Code 2015 - Day 5 (benchmark)."""
+
+import os
+import random
+import string
+import tempfile
+import time
+from pathlib import Path
+
+from main import RulesOne, RulesTwo, count_if, count_nice
+
+
+def count_nice_with_regexps(path):
+    """Count nice words by reading all lines and matching regexps."""
+    lines = Path(path).read_text().splitlines()
+    return (count_if(RulesOne.is_nice, lines),
+            count_if(RulesTwo.is_nice, lines))
+
+
+def measure(label, function, *args, **kwargs):
+    """Time a function and report its result."""
+    start = time.perf_counter()
+    result = function(*args, **kwargs)
+    elapsed = time.perf_counter() - start
+
+    print('  {:<16} {:>20} {:>8.3f} s'.format(label, '{}/{}'.format(*result),
+                                              elapsed))
+
+
+def main():
+    """Compare regexp matching against the byte-level classifier."""
+    NUM_WORDS = 10 ** 6
+    NUM_LONG_WORDS = 1000
+
+    rng = random.Random(2015)
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / 'words.txt'
+        with path.open('w') as file:
+            for _ in range(NUM_WORDS):
+                file.write(''.join(rng.choice(string.ascii_lowercase)
+                                   for _ in range(16)))
+                file.write('\n')
+
+        print('{} words:'.format(NUM_WORDS))
+        measure('regexps', count_nice_with_regexps, path)
+        measure('classifier', count_nice, path)
+        processes = os.cpu_count() or 1
+        measure('pool ({})'.format(processes), count_nice, path,
+                processes=processes)
+
+        # Long words that make the vowel regexp backtrack.
+        with path.open('w') as file:
+            for index in range(NUM_LONG_WORDS):
+                if index % 2:
+                    file.write('ab' * 2000 + 'e\n')
+                else:
+                    file.write('a' + 'z' * 5000 + 'e\n')
+
+        print('{} long words:'.format(NUM_LONG_WORDS))
+        measure('regexps', count_nice_with_regexps, path)
+        measure('classifier', count_nice, path)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,12 +1,20 @@
 """Advent of Code 2015 - Day 5."""
 
+import mmap
+import multiprocessing
+import os
 import re
 from pathlib import Path
 
 
+def input_path():
+    """Determine path of input file."""
+    return Path(__file__).with_name('input.txt')
+
+
 def read_input():
     """Read input file and split into individual lines returned as a list."""
-    return Path(__file__).with_name('input.txt').read_text().splitlines()
+    return input_path().read_text().splitlines()
 
 
 def count_if(predicate, iterable):
@@ -49,12 +57,78 @@ class RulesTwo:
         return cls._RULE_1.search(word) and cls._RULE_2.search(word)
 
 
+# Letters that are not vowels, deleted from words for counting vowels.
+CONSONANTS = bytes(byte for byte in range(256) if byte not in b'aeiou')
+
+# Regular expressions for the remaining rules of both sets (on bytes).
+DOUBLE_REGEXP = re.compile(rb'(.)\1')
+FORBIDDEN_REGEXP = re.compile(rb'ab|cd|pq|xy')
+PAIR_TWICE_REGEXP = re.compile(rb'(..).*\1')
+REPEAT_REGEXP = re.compile(rb'(.).\1')
+
+
+def classify(word):
+    """Check a word (as bytes) against both sets of rules.
+
+    Vowels are counted by deleting all other letters, which avoids the
+    backtracking of the vowel regular expression. All other rules are
+    searched for in the raw bytes, without decoding the word first.
+    """
+    nice_one = (len(word.translate(None, CONSONANTS)) >= 3 and
+                DOUBLE_REGEXP.search(word) is not None and
+                FORBIDDEN_REGEXP.search(word) is None)
+    nice_two = (REPEAT_REGEXP.search(word) is not None and
+                PAIR_TWICE_REGEXP.search(word) is not None)
+    return nice_one, nice_two
+
+
+def count_nice_in_range(path, start, stop):
+    """Count nice words of lines starting within a range of a file."""
+    nice_one = 0
+    nice_two = 0
+
+    with open(str(path), 'rb') as file, \
+            mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        data.seek(start)
+        while data.tell() < stop:
+            line = data.readline().rstrip(b'\r\n')
+            if line:
+                one, two = classify(line)
+                nice_one += one
+                nice_two += two
+
+    return nice_one, nice_two
+
+
+def count_nice(path, processes=1, chunk_size=1 << 24):
+    """Count nice words in a (large) file for both sets of rules.
+
+    The file is split into chunks at line boundaries, which are counted by
+    a pool of worker processes unless a single process is requested.
+    """
+    size = os.path.getsize(str(path))
+    chunks = []
+    with open(str(path), 'rb') as file:
+        start = 0
+        while start < size:
+            file.seek(min(start + chunk_size, size))
+            file.readline()
+            stop = min(file.tell(), size)
+            chunks.append((path, start, stop))
+            start = stop
+
+    if processes == 1:
+        counts = [count_nice_in_range(*chunk) for chunk in chunks]
+    else:
+        with multiprocessing.Pool(processes) as pool:
+            counts = pool.starmap(count_nice_in_range, chunks)
+
+    return tuple(map(sum, zip((0, 0), *counts)))
+
+
 def main():
     """Main entry point of puzzle solution."""
-    lines = read_input()
-
-    part_one = count_if(RulesOne.is_nice, lines)
-    part_two = count_if(RulesTwo.is_nice, lines)
+    part_one, part_two = count_nice(input_path())
 
     print('Part One: {}'.format(part_one))
     print('Part Two: {}'.format(part_two))
@@ -0,0 +1,33 @@
+"""Advent of Code 2015 - Day 6 (benchmark)."""
+
+import time
+
+from main import (BinaryLightArray, BitmaskBinaryLightArray, Command,
+                  CompressedBinaryLightArray, CompressedSteppedLightArray,
+                  NumpyBinaryLightArray, NumpySteppedLightArray,
+                  SteppedLightArray, read_input)
+
+
+def measure(engine, commands):
+    """Time applying commands with the given engine and report the result."""
+    start = time.perf_counter()
+    brightness = engine().apply_commands(commands).brightness()
+    elapsed = time.perf_counter() - start
+
+    print('{:<28} {:>10} {:>8.3f} s'.format(engine.__name__, brightness,
+                                            elapsed))
+
+
+def main():
+    """Compare the per-cell light arrays against alternative engines."""
+    commands = [Command.parse(line) for line in read_input()]
+
+    for engine in [BinaryLightArray, BitmaskBinaryLightArray,
+                   NumpyBinaryLightArray, CompressedBinaryLightArray,
+                   SteppedLightArray, NumpySteppedLightArray,
+                   CompressedSteppedLightArray]:
+        measure(engine, commands)
+
+
+if __name__ == '__main__':
+    main()
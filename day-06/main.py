@@ -3,6 +3,11 @@
 import re
 from pathlib import Path
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 
 def read_input():
     """Read input file and split into individual lines returned as a list."""
@@ -23,6 +28,11 @@ class Rect:
             for y in self.y_range:
                 yield x, y
 
+    def slices(self):
+        """Return a pair of slices that select the rectangle from an array."""
+        return (slice(self.x_range.start, self.x_range.stop),
+                slice(self.y_range.start, self.y_range.stop))
+
 
 class Command:
     """Command used for updating light arrays."""
@@ -103,12 +113,172 @@ class SteppedLightArray(LightArray):
         return self.ACTION_TO_MAPPING[action]
 
 
+class BitmaskBinaryLightArray(LightArray):
+    """Light array where elements are either on or off, one bit per light.
+
+    Each row of lights is stored as a single integer bitmask, such that a
+    command updates a whole row with one bit-wise operation.
+    """
+
+    # Actions and corresponding lambdas for updating a row with a bitmask.
+    ACTION_TO_MAPPING = {
+        'toggle': lambda row, mask: row ^ mask,
+        'turn off': lambda row, mask: row & ~mask,
+        'turn on': lambda row, mask: row | mask,
+    }
+
+    def __init__(self, width=1000, height=1000):
+        """Initialize light array with all elements set to zero."""
+        self.rows = [0] * width
+
+    def brightness(self):
+        """Compute the total brightness of the light array."""
+        return sum(bin(row).count('1') for row in self.rows)
+
+    def _apply_command(self, command):
+        """Update the state of the light array per the given command."""
+        mapping = self.ACTION_TO_MAPPING[command.action]
+        y_range = command.rect.y_range
+        mask = ((1 << len(y_range)) - 1) << y_range.start
+
+        x_slice, _ = command.rect.slices()
+        self.rows[x_slice] = [mapping(row, mask) for row in self.rows[x_slice]]
+
+
+class NumpyLightArray(LightArray):
+    """Abstract light array backed by a NumPy array.
+
+    Each command is applied as a single vectorized operation on the slice of
+    the array that is covered by the command's rectangle.
+    """
+
+    # Data type used for storing the brightness of individual lights.
+    DTYPE = None
+
+    def __init__(self, width=1000, height=1000):
+        """Initialize light array with all elements set to zero."""
+        self.matrix = numpy.zeros((width, height), dtype=self.DTYPE)
+
+    def brightness(self):
+        """Compute the total brightness of the light array."""
+        return int(self.matrix.sum(dtype=numpy.int64))
+
+    def _apply_command(self, command):
+        """Update the state of the light array per the given command."""
+        update = self.ACTION_TO_UPDATE[command.action]
+        update(self.matrix[command.rect.slices()])
+
+
+class NumpyBinaryLightArray(NumpyLightArray):
+    """NumPy-backed light array where elements are either on or off."""
+
+    DTYPE = 'uint8'
+
+    # Actions and corresponding lambdas for updating a region in place.
+    ACTION_TO_UPDATE = {
+        'toggle': lambda region: numpy.bitwise_xor(region, 1, out=region),
+        'turn off': lambda region: region.fill(0),
+        'turn on': lambda region: region.fill(1),
+    }
+
+
+class NumpySteppedLightArray(NumpyLightArray):
+    """NumPy-backed light array with positive integer brightness."""
+
+    DTYPE = 'int32'
+
+    # Actions and corresponding lambdas for updating a region in place.
+    ACTION_TO_UPDATE = {
+        'toggle': lambda region: numpy.add(region, 2, out=region),
+        'turn off': lambda region: numpy.subtract(region, 1, out=region,
+                                                  where=region > 0),
+        'turn on': lambda region: numpy.add(region, 1, out=region),
+    }
+
+
+class CompressedLightArray(NumpyLightArray):
+    """Abstract light array operating on compressed coordinates.
+
+    The rectangle edges of all applied commands partition the grid into
+    cells that are always updated as a whole. Only those cells are stored
+    (weighted by their area), so runtime and memory depend on the number of
+    commands rather than on the size of the grid.
+    """
+
+    def __init__(self, width=1000, height=1000):
+        """Initialize light array with all elements set to zero."""
+        self.x_edges = [0, width]
+        self.y_edges = [0, height]
+        self.matrix = numpy.zeros((1, 1), dtype=self.DTYPE)
+
+    def apply_commands(self, commands):
+        """Apply a list of commands to update the state of the light array."""
+        commands = list(commands)
+        self._refine([command.rect for command in commands])
+
+        self.x_index = {edge: index for index, edge in enumerate(self.x_edges)}
+        self.y_index = {edge: index for index, edge in enumerate(self.y_edges)}
+        for command in commands:
+            self._apply_command(command)
+
+        return self
+
+    def brightness(self):
+        """Compute the total brightness of the light array."""
+        x_widths = numpy.diff(self.x_edges)
+        y_widths = numpy.diff(self.y_edges)
+        return int(x_widths.dot(self.matrix.astype(numpy.int64)).dot(y_widths))
+
+    def _apply_command(self, command):
+        """Update the state of the light array per the given command."""
+        x_range = command.rect.x_range
+        y_range = command.rect.y_range
+        region = self.matrix[self.x_index[x_range.start]:
+                             self.x_index[x_range.stop],
+                             self.y_index[y_range.start]:
+                             self.y_index[y_range.stop]]
+        self.ACTION_TO_UPDATE[command.action](region)
+
+    def _refine(self, rects):
+        """Split cells such that every rectangle edge is also a cell edge."""
+        x_edges = sorted(set(self.x_edges).union(
+            *((rect.x_range.start, rect.x_range.stop) for rect in rects)))
+        y_edges = sorted(set(self.y_edges).union(
+            *((rect.y_range.start, rect.y_range.stop) for rect in rects)))
+
+        # Repeat the state of every old cell for each new cell it contains.
+        x_repeats = numpy.diff(numpy.searchsorted(x_edges, self.x_edges))
+        y_repeats = numpy.diff(numpy.searchsorted(y_edges, self.y_edges))
+        self.matrix = self.matrix.repeat(x_repeats, axis=0)
+        self.matrix = self.matrix.repeat(y_repeats, axis=1)
+
+        self.x_edges = x_edges
+        self.y_edges = y_edges
+
+
+class CompressedBinaryLightArray(CompressedLightArray):
+    """Compressed light array where elements are either on or off."""
+
+    DTYPE = NumpyBinaryLightArray.DTYPE
+    ACTION_TO_UPDATE = NumpyBinaryLightArray.ACTION_TO_UPDATE
+
+
+class CompressedSteppedLightArray(CompressedLightArray):
+    """Compressed light array with positive integer brightness."""
+
+    DTYPE = NumpySteppedLightArray.DTYPE
+    ACTION_TO_UPDATE = NumpySteppedLightArray.ACTION_TO_UPDATE
+
+
 def main():
     """Main entry point of puzzle solution."""
     commands = [Command.parse(line) for line in read_input()]
 
-    part_one = BinaryLightArray().apply_commands(commands).brightness()
-    part_two = SteppedLightArray().apply_commands(commands).brightness()
+    binary = BitmaskBinaryLightArray().apply_commands(commands)
+    stepped = SteppedLightArray().apply_commands(commands)
+
+    part_one = binary.brightness()
+    part_two = stepped.brightness()
 
     print('Part One: {}'.format(part_one))
     print('Part Two: {}'.format(part_two))
@@ -0,0 +1,105 @@
+"""Advent of Code 2015 - Day 7 (benchmark)."""
+
+import random
+import string
+import time
+
+import numpy
+
+from main import Circuit, read_input
+
+
+def wire_name(index):
+    """Map an index to a unique wire name made of lowercase letters."""
+    name = ''
+    index += 1
+    while index:
+        index, digit = divmod(index - 1, 26)
+        name = string.ascii_lowercase[digit] + name
+    return name
+
+
+def generate_lines(num_wires, window, seed=2015):
+    """Generate a random netlist where gates read from preceding wires."""
+    rng = random.Random(seed)
+    lines = ['{} -> {}'.format(rng.randrange(1 << 16), wire_name(0))]
+    for index in range(1, num_wires):
+        lhs = wire_name(rng.randrange(max(0, index - window), index))
+        rhs = wire_name(rng.randrange(max(0, index - window), index))
+        expr = rng.choice(['{0} AND {1}', '{0} OR {1}', 'NOT {0}',
+                           '{0} LSHIFT {2}', '{0} RSHIFT {2}', '{0}'])
+        expr = expr.format(lhs, rhs, rng.randrange(1, 16))
+        lines.append('{} -> {}'.format(expr, wire_name(index)))
+    rng.shuffle(lines)
+    return lines
+
+
+def measure(label, function):
+    """Time a function, noting if it fails due to the recursion limit."""
+    start = time.perf_counter()
+    try:
+        function()
+        status = 'ok'
+    except RecursionError:
+        status = 'RecursionError'
+    elapsed = time.perf_counter() - start
+
+    print('  {:<14} {:>16} {:>8.3f} s'.format(label, status, elapsed))
+
+
+def eval_all(circuit, flush=True):
+    """Evaluate every wire of a circuit with the recursive evaluator."""
+    if flush:
+        circuit.flush()
+    for wire in circuit.gates:
+        circuit.eval(wire)
+
+
+def rewire_all(circuit, wires, incremental):
+    """Rewire each of the given wires and re-evaluate the whole circuit."""
+    for value, wire in enumerate(wires):
+        if not incremental:
+            circuit.flush()
+        circuit.wire_gate(wire, str(value))
+        eval_all(circuit, flush=False)
+
+
+def sweep(circuit, wire, values, target):
+    """Rewire a wire to each of the given values and evaluate a target."""
+    return [circuit.wire_gate(wire, str(value)).eval(target)
+            for value in values]
+
+
+def main():
+    """Compare recursive evaluation against the compiled circuit."""
+    for num_wires, window in [(10000, 10000), (50000, 50000), (50000, 2)]:
+        circuit = Circuit.from_lines(generate_lines(num_wires, window))
+        print('{} wires, window {}:'.format(num_wires, window))
+
+        measure('recursive', lambda: eval_all(circuit))
+        measure('compile', circuit.compile)
+        measure('compiled run', circuit.compile().run)
+
+    # Rewire late wires, whose downstream cones are comparatively small.
+    num_wires = 10000
+    circuit = Circuit.from_lines(generate_lines(num_wires, num_wires))
+    wires = [wire_name(index) for index in range(num_wires - 100, num_wires)]
+    print('{} wires, rewiring {} wires:'.format(num_wires, len(wires)))
+
+    eval_all(circuit)
+    measure('full flush', lambda: rewire_all(circuit, wires, False))
+    eval_all(circuit)
+    measure('incremental', lambda: rewire_all(circuit, wires, True))
+
+    # Sweep the puzzle input over all possible values of wire 'b'.
+    circuit = Circuit.from_lines(read_input())
+    compiled = circuit.compile()
+    values = numpy.arange(1 << 12)
+    print('puzzle input, sweeping {} values:'.format(len(values)))
+
+    measure('incremental', lambda: sweep(circuit, 'b', values, 'a'))
+    measure('batch', lambda: compiled.run_batch({'b': values}, ['a']))
+
+
+if __name__ == '__main__':
+    main()
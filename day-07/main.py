@@ -1,8 +1,15 @@
 """Advent of Code 2015 - Day 7."""
 
+import collections
+import operator
 import re
 from pathlib import Path
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 
 def read_input():
     """Read input file and split into individual lines returned as a list."""
@@ -66,6 +73,10 @@ class Gate:
         """Flush cache with previously computed gate value."""
         self._value = None
 
+    def is_cached(self):
+        """Check if the gate holds a previously computed value."""
+        return self._value is not None
+
     def _eval(self, circuit):
         """Prepare operands and perform actual evaluation of the gate."""
         lhs = self._fetch(circuit, self.lhs)
@@ -112,6 +123,17 @@ class Circuit:
     def __init__(self):
         """Initialize an empty logic circuit."""
         self.gates = {}
+        self.dependents = collections.defaultdict(set)
+
+    def compile(self):
+        """Compile the circuit for fast, non-recursive evaluation."""
+        return CompiledCircuit(self)
+
+    def dependencies(self, wire):
+        """List the wires whose values are needed to evaluate a wire."""
+        gate = self.gates[wire]
+        return [operand.name for operand in (gate.lhs, gate.rhs)
+                if isinstance(operand, Variable)]
 
     def eval(self, wire):
         """Evaluate a wire by asking the associated gate for its value."""
@@ -125,20 +147,165 @@ class Circuit:
         # Simplify chaining method calls.
         return self
 
+    def invalidate(self, wire):
+        """Flush caches of a wire and of all wires that depend on it.
+
+        A gate only holds a value if all gates it depends on hold one, too.
+        Hence the traversal stops at gates without a cached value.
+        """
+        pending = [wire]
+        while pending:
+            wire = pending.pop()
+            gate = self.gates.get(wire)
+            if gate is None or not gate.is_cached():
+                continue
+            gate.flush()
+            pending.extend(self.dependents[wire])
+
+        # Simplify chaining method calls.
+        return self
+
     def wire_gate(self, wire, expr):
-        """Parse a gate expression and assign it to a wire."""
+        """Parse a gate expression and assign it to a wire.
+
+        When rewiring an existing wire, only the caches of the wires that
+        depend on it are flushed, such that later evaluations recompute just
+        the affected gates.
+        """
+        if wire in self.gates:
+            self.invalidate(wire)
+            for dependency in self.dependencies(wire):
+                self.dependents[dependency].discard(wire)
+
         self.gates[wire] = Gate.from_expr(expr)
+        for dependency in self.dependencies(wire):
+            self.dependents[dependency].add(wire)
 
         # Simplify chaining method calls.
         return self
 
 
+class CompiledCircuit:
+    """Logic circuit compiled into a flat list of instructions.
+
+    Gates are ordered topologically, such that every instruction only reads
+    values that were computed by earlier instructions. Operands refer to
+    pre-resolved slots of a value list, with literals stored in extra slots.
+    """
+
+    # Operators and corresponding functions operating on 16-bit values.
+    OPERATOR_TO_FUNCTION = {
+        None: lambda lhs, rhs: rhs,
+        'AND': operator.and_,
+        'LSHIFT': lambda lhs, rhs: (lhs << rhs) & 0xffff,
+        'NOT': lambda lhs, rhs: ~rhs & 0xffff,
+        'OR': operator.or_,
+        'RSHIFT': operator.rshift,
+    }
+
+    def __init__(self, circuit):
+        """Compile a circuit, failing for undefined wires or cycles."""
+        self.order = self._topological_order(circuit)
+        self.slots = {wire: slot for slot, wire in enumerate(self.order)}
+        self.initial_values = [0] * len(self.order)
+
+        self.instructions = []
+        for wire in self.order:
+            gate = circuit.gates[wire]
+            self.instructions.append((
+                self.slots[wire],
+                self.OPERATOR_TO_FUNCTION[gate.operator],
+                self._slot_for(gate.lhs),
+                self._slot_for(gate.rhs),
+            ))
+
+        self._values = None
+
+    def eval(self, wire):
+        """Evaluate a wire, running the whole circuit once if needed."""
+        if self._values is None:
+            self._values = self.run()
+
+        return self._values[self.slots[wire]]
+
+    def run(self):
+        """Run all instructions and return the list of values by slot."""
+        values = list(self.initial_values)
+        for target, function, lhs, rhs in self.instructions:
+            values[target] = function(values[lhs], values[rhs])
+
+        return values
+
+    def run_batch(self, overrides, wires):
+        """Evaluate wires for a batch of input assignments at once.
+
+        Overrides map wires to arrays (or scalars) of values that replace
+        the respective gates. All operations apply element-wise on uint16
+        arrays, and a dict mapping each requested wire to an array of its
+        values across the batch is returned.
+        """
+        values = list(self.initial_values)
+        overridden = set()
+        for wire, override in overrides.items():
+            override = numpy.asarray(override, dtype=numpy.int64) & 0xffff
+            values[self.slots[wire]] = override.astype(numpy.uint16)
+            overridden.add(self.slots[wire])
+
+        for target, function, lhs, rhs in self.instructions:
+            if target not in overridden:
+                values[target] = function(values[lhs], values[rhs])
+
+        batch = [values[slot] for slot in overridden]
+        shape = numpy.broadcast(*batch).shape if batch else ()
+        return {wire: numpy.broadcast_to(values[self.slots[wire]], shape)
+                .astype(numpy.uint16) for wire in wires}
+
+    def _slot_for(self, operand):
+        """Map an operand to the slot holding its value."""
+        if isinstance(operand, Variable):
+            return self.slots[operand.name]
+
+        # Literals (and missing operands, as zero) get a slot of their own.
+        self.initial_values.append(0 if operand is None else operand.value)
+        return len(self.initial_values) - 1
+
+    @staticmethod
+    def _topological_order(circuit):
+        """Order wires such that every wire follows its dependencies."""
+        num_pending = {}
+        dependents = collections.defaultdict(list)
+        for wire in circuit.gates:
+            dependencies = circuit.dependencies(wire)
+            for dependency in dependencies:
+                if dependency not in circuit.gates:
+                    raise RuntimeError(
+                        'Undefined wire {!r}.'.format(dependency))
+                dependents[dependency].append(wire)
+            num_pending[wire] = len(dependencies)
+
+        ready = collections.deque(wire for wire, count in num_pending.items()
+                                  if count == 0)
+        order = []
+        while ready:
+            wire = ready.popleft()
+            order.append(wire)
+            for dependent in dependents[wire]:
+                num_pending[dependent] -= 1
+                if num_pending[dependent] == 0:
+                    ready.append(dependent)
+
+        if len(order) < len(circuit.gates):
+            raise RuntimeError('Circuit contains a cycle.')
+
+        return order
+
+
 def main():
     """Main entry point of puzzle solution."""
     circuit = Circuit.from_lines(read_input())
 
     part_one = circuit.eval('a')
-    part_two = circuit.flush().wire_gate('b', str(part_one)).eval('a')
+    part_two = circuit.wire_gate('b', str(part_one)).eval('a')
 
     print('Part One: {}'.format(part_one))
     print('Part Two: {}'.format(part_two))
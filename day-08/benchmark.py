@@ -0,0 +1,68 @@
+"""Advent of Code 2015 - Day 8 (benchmark)."""
+
+import tempfile
+import time
+from pathlib import Path
+
+from main import decode_string, encode_string, input_path, literal_sizes
+
+
+def literal_sizes_by_line(path):
+    """Determine literal sizes by decoding and encoding every line."""
+    lines = Path(path).read_text().splitlines()
+    return (sum(len(s) for s in lines),
+            sum(len(decode_string(s)) for s in lines),
+            sum(len(encode_string(s)) for s in lines))
+
+
+def check_edge_cases(directory):
+    """Compare results for CRLF line breaks and empty lines."""
+    EDGE_CASES = [
+        b'"a\\x41"\r\n"b"\r\n',
+        b'"a"\n\n',
+        b'\n"\\""\n\n"x"',
+        b'"\\\\"\r\n\r\n"q"',
+        b'',
+    ]
+
+    path = Path(directory) / 'edge_case.txt'
+    for text in EDGE_CASES:
+        path.write_bytes(text)
+        expected = literal_sizes_by_line(path)
+        for chunk_size in [1, 1 << 24]:
+            result = literal_sizes(path, chunk_size)
+            if result != expected:
+                raise RuntimeError('Mismatch for {!r}: {} != {}'.format(
+                    text, result, expected))
+
+
+def measure(label, function, path):
+    """Time a function and report its result."""
+    start = time.perf_counter()
+    result = function(path)
+    elapsed = time.perf_counter() - start
+
+    print('  {:<10} {:>36} {:>8.3f} s'.format(
+        label, '{}/{}/{}'.format(*result), elapsed))
+
+
+def main():
+    """Compare decoding/encoding lines against counting bytes."""
+    SIZE_IN_MIB = 64
+
+    text = input_path().read_bytes()
+    with tempfile.TemporaryDirectory() as directory:
+        check_edge_cases(directory)
+
+        path = Path(directory) / 'literals.txt'
+        with path.open('wb') as file:
+            for _ in range(SIZE_IN_MIB * 2 ** 20 // len(text)):
+                file.write(text)
+
+        print('{:.1f} MiB of literals:'.format(path.stat().st_size / 2 ** 20))
+        measure('by line', literal_sizes_by_line, path)
+        measure('bytes', literal_sizes, path)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,12 +1,19 @@
 """Advent of Code 2015 - Day 8."""
 
+import mmap
+import os
 import re
 from pathlib import Path
 
 
+def input_path():
+    """Determine path of input file."""
+    return Path(__file__).with_name('input.txt')
+
+
 def read_input():
     """Read input file and split into individual lines returned as a list."""
-    return Path(__file__).with_name('input.txt').read_text().splitlines()
+    return input_path().read_text().splitlines()
 
 
 def decode_string(string):
@@ -19,13 +26,57 @@ def encode_string(string):
     return '"{}"'.format(re.sub(r'["\\]', r'\\\0', string))
 
 
+# Regular expression for finding escape sequences in string literals.
+ESCAPE_REGEXP = re.compile(rb'\\(?:[\\"]|(x)[0-9a-f]{2})')
+
+# Regular expression for finding empty lines (chunks start new lines).
+EMPTY_LINE_REGEXP = re.compile(rb'^\r?\n', re.MULTILINE)
+
+
+def literal_sizes(path, chunk_size=1 << 24):
+    """Determine in-file, decoded, and encoded sizes of all string literals.
+
+    The memory-mapped file is processed in chunks ending at line breaks.
+    Per chunk, line breaks, quotation marks, backslashes, and escape
+    sequences are counted, but no decoded or encoded strings are built.
+    Line breaks may be CRLF, and empty lines decode to empty strings.
+    """
+    num_lines = 0
+    num_empty = 0
+    num_bytes = 0
+    num_escaped = 0
+    num_saved = 0
+
+    # Empty files cannot be memory-mapped, but contain no literals anyway.
+    if os.path.getsize(str(path)) == 0:
+        return 0, 0, 0
+
+    with open(str(path), 'rb') as file, \
+            mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        start = 0
+        while start < len(data):
+            stop = data.find(b'\n', start + chunk_size)
+            stop = len(data) if stop < 0 else stop + 1
+            chunk = data[start:stop]
+
+            line_breaks = chunk.count(b'\n')
+            num_lines += line_breaks + (not chunk.endswith(b'\n'))
+            num_empty += len(EMPTY_LINE_REGEXP.findall(chunk))
+            num_bytes += len(chunk) - line_breaks - chunk.count(b'\r\n')
+            num_escaped += chunk.count(b'"') + chunk.count(b'\\')
+            # Escaped characters save one byte, hexadecimal escapes three.
+            escapes = ESCAPE_REGEXP.findall(chunk)
+            num_saved += len(escapes) + 2 * escapes.count(b'x')
+            start = stop
+
+    size_decoded = num_bytes - 2 * (num_lines - num_empty) - num_saved
+    size_encoded = num_bytes + 2 * num_lines + num_escaped
+    return num_bytes, size_decoded, size_encoded
+
+
 def main():
     """Main entry point of puzzle solution."""
-    lines = read_input()
-
-    size_in_file = sum(len(s) for s in lines)
-    size_decoded = sum(len(decode_string(s)) for s in lines)
-    size_encoded = sum(len(encode_string(s)) for s in lines)
+    size_in_file, size_decoded, size_encoded = literal_sizes(input_path())
 
     print('Part One: {}'.format(size_in_file - size_decoded))
     print('Part Two: {}'.format(size_encoded - size_in_file))
@@ -0,0 +1,55 @@
+"""Advent of Code 2015 - Day 9 (benchmark)."""
+
+import itertools
+import random
+import time
+
+from main import CityMap
+
+
+def random_city_map(num_cities, seed=2015):
+    """Generate a map with random distances between all pairs of cities."""
+    rng = random.Random(seed)
+    city_map = CityMap()
+    for source, target in itertools.combinations(range(num_cities), 2):
+        city_map.add_city_pair('City {}'.format(source),
+                               'City {}'.format(target),
+                               rng.randrange(1, 1000))
+
+    return city_map
+
+
+def measure(function):
+    """Time a function and return its result along with the elapsed time."""
+    start = time.perf_counter()
+    result = function()
+    return result, time.perf_counter() - start
+
+
+def main():
+    """Compare enumerating permutations against Held-Karp."""
+    MAX_PERMUTATION_CITIES = 10
+
+    print('{:>6} {:>16} {:>12} {:>16} {:>12}'.format(
+        'cities', 'permutations', 'time', 'held-karp', 'time'))
+    for num_cities in range(4, 21):
+        city_map = random_city_map(num_cities)
+
+        if num_cities <= MAX_PERMUTATION_CITIES:
+            def permutations():
+                """Determine extremes by enumerating all permutations."""
+                lengths = list(city_map.route_lengths())
+                return min(lengths), max(lengths)
+            slow, slow_time = measure(permutations)
+            slow = '{}/{}'.format(*slow)
+            slow_time = '{:.3f} s'.format(slow_time)
+        else:
+            slow, slow_time = '-', '-'
+
+        fast, fast_time = measure(city_map.route_length_extremes)
+        print('{:>6} {:>16} {:>12} {:>16} {:>10.3f} s'.format(
+            num_cities, slow, slow_time, '{}/{}'.format(*fast), fast_time))
+
+
+if __name__ == '__main__':
+    main()
@@ -4,6 +4,11 @@ import itertools
 import re
 from pathlib import Path
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 
 def read_input():
     """Read input file and split into individual lines returned as a list."""
@@ -48,6 +53,55 @@ class CityMap:
         for sources, targets in self.routes():
             yield sum(self.link[pair] for pair in zip(sources, targets))
 
+    def distance_matrix(self):
+        """Build a dense matrix of distances between all pairs of cities."""
+        num_cities = len(self.city)
+        matrix = numpy.zeros((num_cities, num_cities), dtype=numpy.int64)
+        for source, target in itertools.permutations(range(num_cities), 2):
+            matrix[source, target] = self.link[(source, target)]
+
+        return matrix
+
+    def route_length_extremes(self):
+        """Determine lengths of the shortest and longest route in one pass.
+
+        Use the Held-Karp dynamic programming algorithm, where the entry for
+        a set of visited cities (as a bitmask) and a final city holds the
+        shortest/longest route through exactly those cities ending there.
+        Sets of equal size are processed at once, one final city at a time.
+        Impossible entries hold a length beyond that of any route instead of
+        infinity, so the tables can use the narrowest integer type possible.
+        """
+        num_cities = len(self.city)
+        distances = self.distance_matrix()
+
+        unreachable = int(distances.max(initial=0)) * num_cities + 1
+        if 2 * unreachable < numpy.iinfo(numpy.int32).max:
+            distances = distances.astype(numpy.int32)
+
+        shortest = numpy.full((1 << num_cities, num_cities), unreachable,
+                              dtype=distances.dtype)
+        longest = numpy.full((1 << num_cities, num_cities), -unreachable,
+                             dtype=distances.dtype)
+        for city in range(num_cities):
+            shortest[1 << city, city] = 0
+            longest[1 << city, city] = 0
+
+        masks = numpy.arange(1 << num_cities)
+        sizes = sum((masks >> city) & 1 for city in range(num_cities))
+        for size in range(2, num_cities + 1):
+            layer = masks[sizes == size]
+            for city in range(num_cities):
+                bit = 1 << city
+                visited = layer[(layer & bit) != 0]
+                previous = visited ^ bit
+                shortest[visited, city] = numpy.min(
+                    shortest[previous] + distances[:, city], axis=1)
+                longest[visited, city] = numpy.max(
+                    longest[previous] + distances[:, city], axis=1)
+
+        return int(shortest[-1].min()), int(longest[-1].max())
+
 
 def main():
     """Main entry point of puzzle solution."""
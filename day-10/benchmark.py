@@ -0,0 +1,39 @@
+"""Advent of Code 2015 - Day 10 (benchmark)."""
+
+import itertools
+import time
+
+from main import (AudioactiveDecay, look_and_say, look_and_say_bytes,
+                  look_and_say_length)
+
+
+def measure(label, function):
+    """Time a function and report the length it computed."""
+    start = time.perf_counter()
+    length = function()
+    elapsed = time.perf_counter() - start
+
+    print('  {:<10} {:>16.9e} {:>8.3f} s'.format(label, float(length),
+                                                 elapsed))
+
+
+def main():
+    """Compare building elements against tracking audioactive atoms."""
+    INPUT_SEED = '3113322113'
+
+    for steps in [40, 50, 100, 1000]:
+        print('{} steps:'.format(steps))
+        if steps <= 50:
+            for label, generator in [('strings', look_and_say),
+                                     ('bytearray', look_and_say_bytes)]:
+                elements = generator(INPUT_SEED)
+                measure(label, lambda: len(next(itertools.islice(
+                    elements, steps, None))))
+        measure('atoms', lambda: look_and_say_length(INPUT_SEED, steps))
+
+    decay = AudioactiveDecay(INPUT_SEED)
+    print('{} atoms descend from {}.'.format(len(decay.atoms), INPUT_SEED))
+
+
+if __name__ == '__main__':
+    main()
@@ -1,29 +1,180 @@
 """Advent of Code 2015 - Day 10."""
 
+import collections
+import functools
 import itertools
+import re
+
+
+def say(element):
+    """Compute the next element of the look-and-say sequence."""
+    chunks = []
+    for digit, run in itertools.groupby(element):
+        count = sum(1 for _ in run)
+        chunks.append(str(count) + digit)
+    return ''.join(chunks)
 
 
 def look_and_say(seed):
     """Yield elements of the look-and-say sequence starting with the seed."""
-    yield seed
-
     element = seed
     while True:
-        chunks = []
-        for digit, run in itertools.groupby(element):
-            count = sum(1 for _ in run)
-            chunks.append(str(count) + digit)
-        element = ''.join(chunks)
         yield element
+        element = say(element)
+
+
+def look_and_say_bytes(seed):
+    """Yield elements of the look-and-say sequence as compact bytearrays."""
+    run_regexp = re.compile(rb'(.)\1*', re.DOTALL)
+
+    def say_run(match):
+        """Describe a run of equal symbols by its length and the symbol."""
+        return b'%d%c' % (len(match.group()), match.group()[0])
+
+    element = bytearray(seed.encode('ascii'))
+    while True:
+        yield element
+        element = run_regexp.sub(say_run, element)
+
+
+@functools.lru_cache(maxsize=None)
+def first_digits(string, complete=True, cap=64):
+    """Determine all first digits of a string and of all its descendants.
+
+    Only a prefix of at most cap digits is tracked. Once the string had to
+    be truncated, its last run is dropped before each step as it might be
+    incomplete. The sequence of prefixes is followed until it repeats.
+    """
+    digits = set()
+    seen = set()
+    while (string, complete) not in seen:
+        if not string:
+            raise RuntimeError('Failed to track first digits.')
+        seen.add((string, complete))
+        digits.add(string[0])
+
+        if not complete:
+            string = string.rstrip(string[-1])
+        string = say(string)
+        if len(string) > cap:
+            string = string[:cap]
+            complete = False
+
+    return frozenset(digits)
+
+
+def split_atoms(string):
+    """Split a string into parts that evolve independently of each other.
+
+    A string splits between a left and a right part if the last digit of
+    the left part (which is preserved by every step) never equals the first
+    digit of the evolving right part, so their runs can never merge.
+    """
+    atoms = []
+    start = 0
+    for index in range(1, len(string)):
+        if string[index - 1] not in first_digits(string[index:index + 64],
+                                                 len(string) - index <= 64):
+            atoms.append(string[start:index])
+            start = index
+    atoms.append(string[start:])
+    return atoms
+
+
+class AudioactiveDecay:
+    """Decay of look-and-say elements into Conway's audioactive elements.
+
+    A seed is split into atoms, which are followed through the sequence.
+    Every atom decays into a compound of atoms after one step, and after a
+    few steps only (at most 92 common and 2 transuranic) elements remain.
+    Tracking the counts of atoms yields lengths without building strings.
+    """
+
+    def __init__(self, seed, max_atoms=1000):
+        """Discover all atoms descending from the seed and their decays."""
+        self.atoms = []
+        self.index = {}
+        self.decays = []
+
+        pending = collections.deque(split_atoms(seed))
+        while pending:
+            atom = pending.popleft()
+            if atom in self.index:
+                continue
+            if len(self.atoms) == max_atoms:
+                raise RuntimeError('Too many atoms descending from seed.')
+            self.index[atom] = len(self.atoms)
+            self.atoms.append(atom)
+
+            products = split_atoms(say(atom))
+            self.decays.append(products)
+            pending.extend(products)
+
+        # Express decays as counts of products by index.
+        self.decays = [collections.Counter(map(self.index.get, products))
+                       for products in self.decays]
+        self.seed = collections.Counter(self.index[atom]
+                                        for atom in split_atoms(seed))
+
+    def counts_after(self, steps):
+        """Determine counts of atoms after the given number of steps.
+
+        Use exponentiation by squaring of the transition matrix, such that
+        only O(log steps) matrix products are needed.
+        """
+        counts = [self.seed[index] for index in range(len(self.atoms))]
+        matrix = [[decay[index] for index in range(len(self.atoms))]
+                  for decay in self.decays]
+
+        while steps:
+            if steps & 1:
+                counts = self._multiply([counts], matrix)[0]
+            steps >>= 1
+            if steps:
+                matrix = self._multiply(matrix, matrix)
+
+        return counts
+
+    def length_after(self, steps):
+        """Determine the length of the element after the given steps."""
+        counts = self.counts_after(steps)
+        return sum(count * len(atom)
+                   for count, atom in zip(counts, self.atoms))
+
+    @staticmethod
+    def _multiply(lhs, rhs):
+        """Multiply two matrices, skipping zero entries of the left one."""
+        product = []
+        for lhs_row in lhs:
+            row = [0] * len(rhs[0])
+            for index, factor in enumerate(lhs_row):
+                if factor:
+                    for column, value in enumerate(rhs[index]):
+                        row[column] += factor * value
+            product.append(row)
+        return product
+
+
+def look_and_say_length(seed, steps):
+    """Determine the length of the look-and-say element after some steps.
+
+    Track audioactive atoms where possible, otherwise fall back to building
+    the elements as compact bytearrays.
+    """
+    try:
+        return AudioactiveDecay(seed).length_after(steps)
+    except RuntimeError:
+        element = next(itertools.islice(look_and_say_bytes(seed), steps, None))
+        return len(element)
 
 
 def main():
     """Main entry point of puzzle solution."""
     INPUT_SEED = '3113322113'
 
-    look_and_say_40 = itertools.islice(look_and_say(INPUT_SEED), 40, None, 10)
-    for part, element in zip(['One', 'Two'], look_and_say_40):
-        print('Part {}: {}'.format(part, len(element)))
+    for part, steps in zip(['One', 'Two'], [40, 50]):
+        print('Part {}: {}'.format(part, look_and_say_length(INPUT_SEED,
+                                                             steps)))
 
 
 if __name__ == '__main__':
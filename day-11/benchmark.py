@@ -0,0 +1,34 @@
+"""Advent of Code 2015 - Day 11 (benchmark)."""
+
+import itertools
+import time
+
+from main import string_range, valid_password, valid_passwords
+
+
+def measure(label, passwords, count):
+    """Time generating a number of passwords and report the last one."""
+    start = time.perf_counter()
+    last = None
+    for last in itertools.islice(passwords, count):
+        pass
+    elapsed = time.perf_counter() - start
+
+    print('  {:<12} {:>10} {:>8.3f} s'.format(label, last, elapsed))
+
+
+def main():
+    """Compare filtering all successors against the structural search."""
+    INPUT_PASSWORD = 'hepxcrrq'
+
+    for count in [2, 10, 1000]:
+        print('next {} passwords:'.format(count))
+        if count <= 10:
+            successors = itertools.islice(string_range(INPUT_PASSWORD), 1,
+                                          None)
+            measure('filter', filter(valid_password, successors), count)
+        measure('structural', valid_passwords(INPUT_PASSWORD), count)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,6 +1,6 @@
 """Advent of Code 2015 - Day 11."""
 
-import itertools
+import functools
 import re
 import string
 
@@ -54,13 +54,80 @@ def string_range(start, stop=None, symbols=string.ascii_lowercase):
         item_sym[index] = symbols[item_int[index]]
 
 
+# Letters that may appear in a valid password at all (see 2nd rule).
+ALLOWED_LETTERS = [letter for letter in string.ascii_lowercase
+                   if not RULE_2.search(letter)]
+
+
+def advance_state(state, letter):
+    """Update the password rule state for a prefix extended by a letter.
+
+    The state consists of whether a straight was found, the last letter,
+    the length of the current straight, and the letter of the first pair
+    (or True once a second, different pair was found).
+    """
+    straight, last, run, pairs = state
+    if last is not None and ord(letter) == ord(last) + 1:
+        run = min(run + 1, 3)
+    else:
+        run = 1
+    if letter == last and pairs is not True and pairs != letter:
+        pairs = letter if pairs is None else True
+
+    return straight or run == 3, letter, run, pairs
+
+
+# Rule state for an empty prefix.
+EMPTY_STATE = (False, None, 0, None)
+
+
+@functools.lru_cache(maxsize=None)
+def can_complete(remaining, state):
+    """Check if a prefix can be completed to a valid password."""
+    if remaining == 0:
+        straight, _, _, pairs = state
+        return straight and pairs is True
+
+    return any(can_complete(remaining - 1, advance_state(state, letter))
+               for letter in ALLOWED_LETTERS)
+
+
+def valid_passwords(password):
+    """Yield valid passwords following the given one in increasing order.
+
+    Instead of testing every successor, build passwords letter by letter in
+    lexicographic order. Forbidden letters are never used (which skips any
+    range of successors starting with them) and prefixes that cannot be
+    completed to a valid password are not explored.
+    """
+    def suffixes(index, state, tight):
+        """Yield valid suffixes, bounded below by the password if tight."""
+        remaining = len(password) - index
+        if remaining == 0:
+            # Skip the given password itself, even if it would be valid.
+            if not tight:
+                yield ''
+            return
+
+        lowest = password[index] if tight else ALLOWED_LETTERS[0]
+        for letter in ALLOWED_LETTERS:
+            if letter < lowest:
+                continue
+            next_state = advance_state(state, letter)
+            if not can_complete(remaining - 1, next_state):
+                continue
+            for suffix in suffixes(index + 1, next_state,
+                                   tight and letter == lowest):
+                yield letter + suffix
+
+    return suffixes(0, EMPTY_STATE, True)
+
+
 def main():
     """Main entry point of puzzle solution."""
     INPUT_PASSWORD = 'hepxcrrq'
 
-    # Make sure to skip over input password, even if it would be valid.
-    next_passwords = itertools.islice(string_range(INPUT_PASSWORD), 1, None)
-    good_passwords = filter(valid_password, next_passwords)
+    good_passwords = valid_passwords(INPUT_PASSWORD)
     for part, password in zip(['One', 'Two'], good_passwords):
         print('Part {}: {}'.format(part, password))
 
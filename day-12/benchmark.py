@@ -0,0 +1,55 @@
+"""Advent of Code 2015 - Day 12 (benchmark)."""
+
+import json
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from main import (input_path, is_number, is_red_dict, sum_numbers,
+                  traverse_json)
+
+
+def sum_numbers_in_memory(path):
+    """Sum numbers by loading the whole document and walking it twice."""
+    data = json.loads(Path(path).read_text())
+    return (sum(filter(is_number, traverse_json(data))),
+            sum(filter(is_number, traverse_json(data, filter=is_red_dict))))
+
+
+def measure(label, function, path):
+    """Time a function and report its results and peak memory use."""
+    start = time.perf_counter()
+    result = function(path)
+    elapsed = time.perf_counter() - start
+
+    # Trace allocations in a separate run, as tracing distorts timing.
+    tracemalloc.start()
+    function(path)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print('  {:<12} {:>28} {:>8.3f} s {:>10.1f} MiB'.format(
+        label, '{}/{}'.format(*result), elapsed, peak / 2 ** 20))
+
+
+def main():
+    """Compare loading the document against streaming it."""
+    NUM_COPIES = 200
+
+    text = input_path().read_text()
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / 'large.json'
+        with path.open('w') as file:
+            file.write('[')
+            file.write(','.join([text] * NUM_COPIES))
+            file.write(']')
+
+        print('{} copies of the input ({:.1f} MiB):'.format(
+            NUM_COPIES, path.stat().st_size / 2 ** 20))
+        measure('in memory', sum_numbers_in_memory, path)
+        measure('streaming', sum_numbers, path)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,13 +1,20 @@
 """Advent of Code 2015 - Day 12."""
 
 import json
+import mmap
 import numbers
+import re
 from pathlib import Path
 
 
+def input_path():
+    """Determine path of input file."""
+    return Path(__file__).with_name('input.json')
+
+
 def read_input():
     """Read input file."""
-    return Path(__file__).with_name('input.json').read_text()
+    return input_path().read_text()
 
 
 def traverse_json(data, filter=None):
@@ -35,12 +42,71 @@ def is_red_dict(item):
     return isinstance(item, dict) and 'red' in item.values()
 
 
+# Regular expression for tokenizing (well-formed) JSON documents.
+TOKEN_REGEXP = re.compile(rb'(?P<string>"(?:[^"\\]|\\.)*")|'
+                          rb'(?P<number>-?[0-9][-+.0-9eE]*)|'
+                          rb'(?P<open>[{[])|(?P<close>[}\]])|(?P<colon>:)|,')
+
+
+def is_red_token(token):
+    """Check if a string token represents a red value."""
+    if token == b'"red"':
+        return True
+
+    # Resolve escape sequences only for short strings that might be red.
+    return (len(token) <= 20 and b'\\' in token and
+            json.loads(token.decode('utf-8')) == 'red')
+
+
+def parse_number(token):
+    """Parse a number token into an int or a float."""
+    try:
+        return int(token)
+    except ValueError:
+        return float(token)
+
+
+def sum_numbers(path):
+    """Sum all numbers in a JSON file, with and without red dicts.
+
+    The memory-mapped file is tokenized in a single pass. An explicit stack
+    holds one frame per open object or array with the running sum of its
+    numbers (excluding red dicts) and whether a red value was seen at its
+    level. On closing, the sum is discarded for red objects and added to
+    the enclosing frame otherwise. Memory use is thus bounded by the
+    nesting depth of the document.
+    """
+    total = 0
+    stack = [[0, False]]
+    expect_value = False
+
+    with open(str(path), 'rb') as file, \
+            mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        for match in TOKEN_REGEXP.finditer(data):
+            kind = match.lastgroup
+            if kind == 'number':
+                number = parse_number(match.group())
+                total += number
+                stack[-1][0] += number
+            elif kind == 'string':
+                if expect_value and is_red_token(match.group()):
+                    stack[-1][1] = True
+            elif kind == 'open':
+                stack.append([0, False])
+            elif kind == 'close':
+                subtotal, red = stack.pop()
+                if not red:
+                    stack[-1][0] += subtotal
+
+            # Only the token right after a colon is the value of an object.
+            expect_value = kind == 'colon'
+
+    return total, stack[0][0]
+
+
 def main():
     """Main entry point of puzzle solution."""
-    data = json.loads(read_input())
-
-    part_one = sum(filter(is_number, traverse_json(data)))
-    part_two = sum(filter(is_number, traverse_json(data, filter=is_red_dict)))
+    part_one, part_two = sum_numbers(input_path())
 
     print('Part One: {}'.format(part_one))
     print('Part Two: {}'.format(part_two))
@@ -0,0 +1,57 @@
+"""Advent of Code 2015 - Day 13 (benchmark)."""
+
+import itertools
+import random
+import time
+
+from main import AmityMap
+
+
+def random_amity_map(num_people, seed=2015):
+    """Generate a map with random amities between all pairs of people."""
+    rng = random.Random(seed)
+    amity_map = AmityMap()
+    for foo, bar in itertools.permutations(range(num_people), 2):
+        amity_map.add_amity_pair('Person {}'.format(foo),
+                                 'Person {}'.format(bar),
+                                 rng.randrange(-100, 101))
+
+    return amity_map
+
+
+def measure(function):
+    """Time a function and return its result along with the elapsed time."""
+    start = time.perf_counter()
+    result = function()
+    return result, time.perf_counter() - start
+
+
+def main():
+    """Compare enumerating permutations against dynamic programming."""
+    MAX_PERMUTATION_PEOPLE = 8
+
+    print('{:>6} {:>16} {:>12} {:>16} {:>12}'.format(
+        'people', 'permutations', 'time', 'dynamic', 'time'))
+    for num_people in range(4, 17):
+        amity_map = random_amity_map(num_people)
+
+        if num_people <= MAX_PERMUTATION_PEOPLE:
+            def permutations():
+                """Determine best happinesses by enumerating permutations."""
+                table = max(amity_map.arrangement_happinesses())
+                path = max(random_amity_map(num_people).add_self()
+                           .arrangement_happinesses())
+                return table, path
+            slow, slow_time = measure(permutations)
+            slow = '{}/{}'.format(*slow)
+            slow_time = '{:.3f} s'.format(slow_time)
+        else:
+            slow, slow_time = '-', '-'
+
+        fast, fast_time = measure(amity_map.best_happinesses)
+        print('{:>6} {:>16} {:>12} {:>16} {:>10.3f} s'.format(
+            num_people, slow, slow_time, '{}/{}'.format(*fast), fast_time))
+
+
+if __name__ == '__main__':
+    main()
@@ -66,13 +66,63 @@ class AmityMap:
                 happiness += self.amity[(foo, bar)] + self.amity[(bar, foo)]
             yield happiness
 
+    def pair_weights(self):
+        """Build a symmetric matrix of combined amities for pairs of people."""
+        num_people = len(self.names)
+        weights = [[0] * num_people for _ in range(num_people)]
+        for (foo, bar), happiness in self.amity.items():
+            weights[foo][bar] += happiness
+            weights[bar][foo] += happiness
+
+        return weights
+
+    def best_happinesses(self):
+        """Determine best happiness without and with a neutral self.
+
+        Use dynamic programming over seating paths that start with the first
+        person, keyed by the set of other seated people (as a bitmask) and
+        the last seated person. Closing such a path yields a seating around
+        the table. A neutral self turns the best seating into the best path,
+        which is obtained by joining two paths starting with the first
+        person that seat complementary sets of the other people.
+        """
+        weights = self.pair_weights()
+        num_people = len(weights)
+        if num_people < 2:
+            return 0, 0
+
+        all_seated = (1 << (num_people - 1)) - 1
+        unseen = float('-inf')
+
+        best = [[unseen] * num_people for _ in range(all_seated + 1)]
+        best[0][0] = 0
+        for seated in range(all_seated + 1):
+            for last, happiness in enumerate(best[seated]):
+                if happiness == unseen:
+                    continue
+                for other in range(1, num_people):
+                    bit = 1 << (other - 1)
+                    if seated & bit:
+                        continue
+                    candidate = happiness + weights[last][other]
+                    if candidate > best[seated | bit][other]:
+                        best[seated | bit][other] = candidate
+
+        table = max(best[all_seated][last] + weights[last][0]
+                    for last in range(1, num_people))
+
+        reach = [max(row) for row in best]
+        path = max(reach[seated] + reach[all_seated ^ seated]
+                   for seated in range(all_seated + 1))
+
+        return table, path
+
 
 def main():
     """Main entry point of puzzle solution."""
     amity_map = AmityMap.from_lines(read_input())
 
-    part_one = max(amity_map.arrangement_happinesses())
-    part_two = max(amity_map.add_self().arrangement_happinesses())
+    part_one, part_two = amity_map.best_happinesses()
 
     print('Part One: {}'.format(part_one))
     print('Part Two: {}'.format(part_two))
@@ -0,0 +1,54 @@
+"""Advent of Code 2015 - Day 14 (benchmark)."""
+
+import random
+import time
+
+from main import Reindeer, ReindeerRace, read_input
+
+
+def random_race(num_reindeer, seed=2015):
+    """Generate a race with a stable of reindeer with random properties."""
+    rng = random.Random(seed)
+    race = ReindeerRace()
+    for index in range(num_reindeer):
+        race.stable.append(Reindeer('Reindeer {}'.format(index),
+                                    rng.randrange(5, 30),
+                                    rng.randrange(2, 20),
+                                    rng.randrange(20, 200)))
+
+    return race
+
+
+def measure(label, function, *args):
+    """Time a function and report its result."""
+    start = time.perf_counter()
+    result = function(*args)
+    elapsed = time.perf_counter() - start
+
+    print('  {:<16} {!s:>24} {:>8.3f} s'.format(label, result, elapsed))
+
+
+def main():
+    """Compare stepping through races against closed-form computations."""
+    cases = [
+        ('input', ReindeerRace.from_lines(read_input()), [2503], True),
+        ('random', random_race(1000), [10 ** 4, 10 ** 5], True),
+        ('random', random_race(10 ** 5), [10 ** 5, 10 ** 6], False),
+    ]
+
+    for name, race, target_times, stepping in cases:
+        print('{} ({} reindeer), {} seconds:'.format(
+            name, len(race.stable), '/'.join(map(str, target_times))))
+        if stepping:
+            measure('distance (loop)', lambda: [
+                race.winning_distance_after(target_time)
+                for target_time in target_times])
+            measure('points (step)', lambda: [
+                race.winning_points_after(target_time)
+                for target_time in target_times[:1]])
+        measure('distance', race.winning_distances_after, target_times)
+        measure('points', race.winning_points_after_times, target_times)
+
+
+if __name__ == '__main__':
+    main()
@@ -4,6 +4,11 @@ import itertools
 import re
 from pathlib import Path
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 
 def read_input():
     """Read input file and split into individual lines returned as a list."""
@@ -20,6 +25,12 @@ class Reindeer:
         self.race_time = race_time
         self.rest_time = rest_time
 
+    def distance_after(self, time):
+        """Determine distance traveled after the given time in closed form."""
+        laps, lap_rest = divmod(time, self.race_time + self.rest_time)
+        return self.speed * (laps * self.race_time +
+                             min(lap_rest, self.race_time))
+
     def race(self):
         """Yield traveled distances at discrete times for an infinite race."""
         lap_time = self.race_time + self.rest_time
@@ -61,11 +72,8 @@ class ReindeerRace:
 
     def winning_distance_after(self, target_time):
         """Determine the winning distance of the best reindeer of a race."""
-        def distance_after_race(reindeer):
-            """Determine distance traveled by reindeer after a given time."""
-            return next(itertools.islice(reindeer.race(), target_time, None))
-
-        return max(map(distance_after_race, self.stable))
+        return max(reindeer.distance_after(target_time)
+                   for reindeer in self.stable)
 
     def winning_points_after(self, target_time):
         """Determine the winning points of the best reindeer of a race."""
@@ -82,6 +90,68 @@ class ReindeerRace:
 
         return max(points)
 
+    def stable_arrays(self):
+        """Convert racing properties of the stable to arrays."""
+        def property_array(name):
+            """Collect a property of all reindeer in an array."""
+            return numpy.array([getattr(reindeer, name)
+                                for reindeer in self.stable],
+                               dtype=numpy.int64)
+
+        speed = property_array('speed')
+        race_time = property_array('race_time')
+        lap_time = race_time + property_array('rest_time')
+        return speed, race_time, lap_time
+
+    @staticmethod
+    def distances_after(times, speed, race_time, lap_time):
+        """Determine distances after given times (with broadcasting)."""
+        laps, lap_rest = numpy.divmod(times, lap_time)
+        return speed * (laps * race_time + numpy.minimum(lap_rest, race_time))
+
+    def winning_distances_after(self, target_times):
+        """Determine the winning distances for many target times at once."""
+        stable = self.stable_arrays()
+        return [int(self.distances_after(target_time, *stable).max())
+                for target_time in target_times]
+
+    def winning_points_after_times(self, target_times, block_size=1024,
+                                   max_elements=1 << 20):
+        """Determine the winning points for many target times at once.
+
+        The race is simulated in blocks of seconds. As distances never
+        decrease, only reindeer that will have caught up with the leader at
+        the start of a block by its end can lead during the block. Distances
+        of those candidates are computed for several seconds at once, such
+        that at most max_elements distances are held in memory.
+        """
+        speed, race_time, lap_time = self.stable_arrays()
+        points = numpy.zeros(len(self.stable), dtype=numpy.int64)
+
+        winning_points = {}
+        time = 0
+        for target_time in sorted(set(target_times)):
+            while time < target_time:
+                stop = min(time + block_size, target_time)
+                leading = self.distances_after(time + 1, speed, race_time,
+                                               lap_time).max()
+                final = self.distances_after(stop, speed, race_time, lap_time)
+                candidates = numpy.flatnonzero(final >= leading)
+                stable = (speed[candidates], race_time[candidates],
+                          lap_time[candidates])
+
+                sub_block_size = max(1, max_elements // len(candidates))
+                for start in range(time + 1, stop + 1, sub_block_size):
+                    times = numpy.arange(start, min(start + sub_block_size,
+                                                    stop + 1))[:, None]
+                    distances = self.distances_after(times, *stable)
+                    leaders = distances == distances.max(axis=1)[:, None]
+                    points[candidates] += leaders.sum(axis=0)
+                time = stop
+            winning_points[target_time] = int(points.max())
+
+        return [winning_points[target_time] for target_time in target_times]
+
 
 def main():
     """Main entry point of puzzle solution."""
@@ -0,0 +1,53 @@
+"""Advent of Code 2015 - Day 15 (benchmark)."""
+
+import random
+import time
+
+from main import Recipe, read_input
+
+
+def random_recipe(num_ingredients, seed=2015):
+    """Generate a recipe with random properties similar to the input."""
+    rng = random.Random(seed)
+    recipe = Recipe()
+    for index in range(num_ingredients):
+        properties = {name: rng.randrange(-3, 6)
+                      for name in ['capacity', 'durability', 'flavor',
+                                   'texture']}
+        properties['calories'] = rng.randrange(1, 9)
+        recipe.add_ingredient('Ingredient {}'.format(index), properties)
+
+    return recipe
+
+
+def measure(label, function, **kwargs):
+    """Time a function and report its result."""
+    start = time.perf_counter()
+    result = function(**kwargs)
+    elapsed = time.perf_counter() - start
+
+    print('  {:<12} {!s:>16} {:>8.3f} s'.format(label, result, elapsed))
+
+
+def main():
+    """Compare the exhaustive search against the pruned search."""
+    cases = [
+        ('input', Recipe.from_lines(read_input()), 100, True),
+        ('input', Recipe.from_lines(read_input()), 1000, False),
+        ('random', random_recipe(6), 100, False),
+        ('random', random_recipe(7), 50, False),
+    ]
+
+    for name, recipe, teaspoons, exhaustive in cases:
+        for calories in [None, 5 * teaspoons]:
+            print('{} ({} ingredients), {} teaspoons, calories {}:'.format(
+                name, len(recipe.ingredients), teaspoons, calories))
+            if exhaustive:
+                measure('exhaustive', recipe.best_score,
+                        teaspoons=teaspoons, calories=calories)
+            measure('pruned', recipe.best_score_pruned,
+                    teaspoons=teaspoons, calories=calories)
+
+
+if __name__ == '__main__':
+    main()
@@ -5,6 +5,11 @@ import operator
 import re
 from pathlib import Path
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 
 def read_input():
     """Read input file and split into individual lines returned as a list."""
@@ -37,6 +42,9 @@ class Recipe:
     # Regular expression for extracting name and properties from ingredient.
     INGREDIENT_REGEXP = re.compile(r'^(?P<name>\w+): (?P<properties>.*)$')
 
+    # Maximum number of partial compositions processed at once.
+    BATCH_SIZE = 1 << 16
+
     # Regular expression for splitting properties into name-value pairs.
     PROPERTY_REGEXP = re.compile(r'(\w+) ([+-]?\d+)')
 
@@ -64,6 +72,141 @@ class Recipe:
         """Best score of all valid combinations of ingredients."""
         return max(self.__all_scores(**kwargs), default=None)
 
+    def best_score_pruned(self, teaspoons=None, calories=None):
+        """Best score of all valid combinations, using a pruned search.
+
+        Only compositions of the given number of teaspoons are enumerated,
+        one ingredient at a time and in batches of partial compositions.
+        Partial compositions are dropped once some property cannot become
+        positive anymore, the calories target is out of reach, or the best
+        score cannot be improved upon. The last two ingredients are solved
+        for directly (with a calories target) or by bisection.
+        """
+        calo_weights, prop_weights = self.__setup_weights()
+        calo_weights = numpy.array(calo_weights, dtype=numpy.int64)
+        prop_weights = numpy.array(prop_weights, dtype=numpy.int64).T
+
+        # Upper/lower bounds on weights of all ingredients from index on.
+        prop_max = numpy.maximum.accumulate(prop_weights[::-1])[::-1]
+        calo_max = numpy.maximum.accumulate(calo_weights[::-1])[::-1]
+        calo_min = numpy.minimum.accumulate(calo_weights[::-1])[::-1]
+
+        best = None
+
+        def record(scores):
+            """Keep track of the best score seen so far."""
+            nonlocal best
+            if len(scores):
+                score = int(scores.max())
+                if best is None or score > best:
+                    best = score
+
+        def maximize_last_two(index, props, calos, remaining):
+            """Find best amounts of the last two ingredients by bisection.
+
+            The score is a product of affine functions of the amount of the
+            second to last ingredient, which is log-concave where all of
+            them are positive. Hence the score is unimodal on that interval
+            and the first amount not improving on its successor is optimal.
+            """
+            if calories:
+                calos = calos + remaining * calo_weights[index + 1]
+                rows = calos == calories
+                props, remaining = props[rows], remaining[rows]
+
+            base = props + remaining[:, None] * prop_weights[index + 1]
+            slope = prop_weights[index] - prop_weights[index + 1]
+
+            # Determine amounts where all properties are positive.
+            lower = numpy.zeros_like(remaining)
+            upper = remaining.copy()
+            for prop_base, prop_slope in zip(base.T, slope):
+                if prop_slope > 0:
+                    lower = numpy.maximum(lower, -prop_base // prop_slope + 1)
+                elif prop_slope < 0:
+                    upper = numpy.minimum(upper,
+                                          (prop_base - 1) // -prop_slope)
+                else:
+                    upper[prop_base <= 0] = -1
+            rows = lower <= upper
+            base, lower, upper = base[rows], lower[rows], upper[rows]
+
+            def score(amounts):
+                """Compute scores for the given amounts, row by row."""
+                return (base + amounts[:, None] * slope).prod(axis=1)
+
+            active = lower < upper
+            while active.any():
+                middle = (lower + upper) // 2
+                descending = score(middle + 1) <= score(middle)
+                upper = numpy.where(active & descending, middle, upper)
+                lower = numpy.where(active & ~descending, middle + 1, lower)
+                active = lower < upper
+
+            record(score(lower))
+
+        def expand(index, props, calos, remaining):
+            """Complete batches of partial compositions, tracking the best."""
+            if index == len(self.ingredients) - 1:
+                props = props + remaining[:, None] * prop_weights[index]
+                calos = calos + remaining * calo_weights[index]
+                if calories:
+                    props = props[calos == calories]
+                record(props[(props > 0).all(axis=1)].prod(axis=1))
+                return
+
+            last_two = index == len(self.ingredients) - 2
+            if (last_two and calories and
+                    calo_weights[index] != calo_weights[index + 1]):
+                # Solve for the amount of this ingredient directly.
+                excess = calories - calos - remaining * calo_weights[index + 1]
+                slope = calo_weights[index] - calo_weights[index + 1]
+                amounts = excess // slope
+                rows = ((excess % slope == 0) &
+                        (amounts >= 0) & (amounts <= remaining))
+                parents = numpy.flatnonzero(rows)
+                amounts = amounts[rows]
+            elif last_two:
+                maximize_last_two(index, props, calos, remaining)
+                return
+            else:
+                # Pair every partial composition with every possible amount.
+                parents = numpy.repeat(numpy.arange(len(remaining)),
+                                       remaining + 1)
+                offsets = numpy.cumsum(remaining + 1) - (remaining + 1)
+                amounts = numpy.arange(len(parents)) - offsets[parents]
+
+            props = props[parents] + amounts[:, None] * prop_weights[index]
+            calos = calos[parents] + amounts * calo_weights[index]
+            remaining = remaining[parents] - amounts
+
+            # Drop compositions where a property can no longer be positive,
+            # or where even the most optimistic score is not an improvement.
+            bounds = props + remaining[:, None] * prop_max[index + 1]
+            rows = (bounds > 0).all(axis=1)
+            if best is not None:
+                rows &= bounds.prod(axis=1) > best
+            if calories:
+                rows &= calos + remaining * calo_min[index + 1] <= calories
+                rows &= calos + remaining * calo_max[index + 1] >= calories
+            props, calos, remaining = props[rows], calos[rows], remaining[rows]
+
+            # Visit the most promising compositions first.
+            order = numpy.argsort(-bounds[rows].prod(axis=1), kind='stable')
+            props, calos, remaining = (props[order], calos[order],
+                                       remaining[order])
+
+            for start in range(0, len(remaining), self.BATCH_SIZE):
+                batch = slice(start, start + self.BATCH_SIZE)
+                expand(index + 1, props[batch], calos[batch],
+                       remaining[batch])
+
+        props = numpy.zeros((1, prop_weights.shape[1]), dtype=numpy.int64)
+        calos = numpy.zeros(1, dtype=numpy.int64)
+        remaining = numpy.array([teaspoons], dtype=numpy.int64)
+        expand(0, props, calos, remaining)
+        return best
+
     def __all_scores(self, teaspoons=None, calories=None):
         """Yield scores for valid combinations of ingredients."""
         calo_weights, prop_weights = self.__setup_weights()
@@ -0,0 +1,72 @@
+"""Advent of Code 2015 - Day 16 (benchmark)."""
+
+import operator
+import random
+import time
+
+from main import Aunt, AuntIndex
+
+
+# Attributes that describe aunts.
+ATTRIBUTES = ['children', 'cats', 'samoyeds', 'pomeranians', 'akitas',
+              'vizslas', 'goldfish', 'trees', 'cars', 'perfumes']
+
+
+def random_aunts(num_aunts, rng):
+    """Generate aunts described by three random attributes each."""
+    return [Aunt(number, [(key, rng.randrange(100))
+                          for key in rng.sample(ATTRIBUTES, 3)])
+            for number in range(1, num_aunts + 1)]
+
+
+def random_query(rng):
+    """Generate a random description with random relational operators."""
+    wanted_value = {key: rng.randrange(100) for key in ATTRIBUTES}
+    wanted_relop = {key: rng.choice([operator.gt, operator.lt])
+                    for key in rng.sample(ATTRIBUTES, 2)}
+    return wanted_value, wanted_relop
+
+
+def measure(label, function):
+    """Time a function and report its result."""
+    start = time.perf_counter()
+    result = function()
+    elapsed = time.perf_counter() - start
+
+    print('  {:<12} {:>12} {:>8.3f} s'.format(label, result, elapsed))
+
+
+def main():
+    """Compare matching every aunt against querying the index."""
+    NUM_AUNTS = 10 ** 6
+    NUM_QUERIES = 100
+
+    rng = random.Random(2015)
+    aunts = random_aunts(NUM_AUNTS, rng)
+    queries = [random_query(rng) for _ in range(NUM_QUERIES)]
+    print('{} aunts, {} queries:'.format(NUM_AUNTS, NUM_QUERIES))
+
+    def linear():
+        """Match every aunt against every query."""
+        return sum(len([aunt for aunt in aunts if aunt.match(*query)])
+                   for query in queries)
+
+    index = None
+
+    def build():
+        """Build the index."""
+        nonlocal index
+        index = AuntIndex(aunts)
+        return len(index.groups)
+
+    def indexed():
+        """Answer every query using the index."""
+        return sum(len(index.match(*query)) for query in queries)
+
+    measure('linear', linear)
+    measure('build index', build)
+    measure('indexed', indexed)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,5 +1,7 @@
 """Advent of Code 2015 - Day 16."""
 
+import bisect
+import collections
 import operator
 import re
 from pathlib import Path
@@ -49,6 +51,79 @@ def find_aunt(aunts, wanted_value, wanted_relop={}):
     raise RuntimeError('Failed to find uniquely matching aunt.')
 
 
+class AuntIndex:
+    """Index of aunts for answering many description queries quickly.
+
+    Aunts are grouped by the set of attributes that describe them. Within a
+    group, the values of every attribute are kept in a sorted list together
+    with the numbers of the aunts having them, so the aunts satisfying a
+    relation form a contiguous range that is located by bisection.
+    """
+
+    # Relational operators and corresponding ranges of a sorted value list.
+    RELOP_TO_RANGE = {
+        operator.eq: lambda values, wanted: (
+            bisect.bisect_left(values, wanted),
+            bisect.bisect_right(values, wanted)),
+        operator.gt: lambda values, wanted: (
+            bisect.bisect_right(values, wanted), len(values)),
+        operator.ge: lambda values, wanted: (
+            bisect.bisect_left(values, wanted), len(values)),
+        operator.lt: lambda values, wanted: (
+            0, bisect.bisect_left(values, wanted)),
+        operator.le: lambda values, wanted: (
+            0, bisect.bisect_right(values, wanted)),
+    }
+
+    def __init__(self, aunts):
+        """Build the index from a list of aunts."""
+        self.aunts = {aunt.number: aunt for aunt in aunts}
+
+        groups = collections.defaultdict(list)
+        for aunt in aunts:
+            groups[frozenset(key for key, _ in aunt.infos)].append(aunt)
+
+        self.groups = {}
+        for keys, members in groups.items():
+            columns = {}
+            infos = [(dict(aunt.infos), aunt.number) for aunt in members]
+            for key in keys:
+                pairs = sorted((info[key], number) for info, number in infos)
+                columns[key] = ([value for value, _ in pairs],
+                                [number for _, number in pairs])
+            numbers = [aunt.number for aunt in members]
+            self.groups[keys] = columns, numbers
+
+    def match(self, wanted_value, wanted_relop={}):
+        """List all aunts that match the given description.
+
+        Within every group, the candidates are taken from the narrowest
+        range of any attribute and then checked against the description.
+        """
+        matched = []
+        for keys, (columns, numbers) in self.groups.items():
+            narrowest = numbers
+            for key in keys & wanted_value.keys():
+                relop = wanted_relop.get(key, operator.eq)
+                values, key_numbers = columns[key]
+                start, stop = self.RELOP_TO_RANGE[relop](values,
+                                                         wanted_value[key])
+                if stop - start < len(narrowest):
+                    narrowest = key_numbers[start:stop]
+
+            matched.extend(aunt for aunt in map(self.aunts.get, narrowest)
+                           if aunt.match(wanted_value, wanted_relop))
+
+        return sorted(matched, key=operator.attrgetter('number'))
+
+    def find_aunt(self, wanted_value, wanted_relop={}):
+        """Find aunt that uniquely matches the given description."""
+        matched = self.match(wanted_value, wanted_relop)
+        if len(matched) == 1:
+            return matched[0]
+        raise RuntimeError('Failed to find uniquely matching aunt.')
+
+
 def main():
     """Main entry point of puzzle solution."""
     WANTED_VALUE = {
@@ -71,10 +146,10 @@ def main():
         'goldfish': operator.lt,
     }
 
-    aunts = [Aunt.from_line(line) for line in read_input()]
+    index = AuntIndex([Aunt.from_line(line) for line in read_input()])
 
-    part_one = find_aunt(aunts, WANTED_VALUE).number
-    part_two = find_aunt(aunts, WANTED_VALUE, WANTED_RELOP).number
+    part_one = index.find_aunt(WANTED_VALUE).number
+    part_two = index.find_aunt(WANTED_VALUE, WANTED_RELOP).number
 
     print('Part One: {}'.format(part_one))
     print('Part Two: {}'.format(part_two))
@@ -0,0 +1,49 @@
+"""Advent of Code 2015 - Day 17 (benchmark)."""
+
+import random
+import time
+
+from main import (count_variants_by_length, enum_shortest, enum_variants,
+                  read_input)
+
+
+def measure(label, function):
+    """Time a function and report its result."""
+    start = time.perf_counter()
+    result = function()
+    elapsed = time.perf_counter() - start
+
+    print('  {:<12} {:>32} {:>8.3f} s'.format(label, result, elapsed))
+
+
+def main():
+    """Compare enumerating combinations against counting them."""
+    rng = random.Random(2015)
+    cases = [
+        ('input', read_input(), 150, True),
+        ('random', [rng.randrange(5, 50) for _ in range(30)], 300, True),
+        ('random', [rng.randrange(5, 50) for _ in range(100)], 1000, False),
+    ]
+
+    for name, containers, volume, enumerable in cases:
+        print('{} ({} containers), {} liters:'.format(name, len(containers),
+                                                      volume))
+        if enumerable:
+            def enumerating():
+                """Count combinations by enumerating them."""
+                variants = list(enum_variants(containers, volume))
+                shortest = list(enum_shortest(variants))
+                return '{}/{}'.format(len(variants), len(shortest))
+            measure('enumerating', enumerating)
+
+        def counting():
+            """Count combinations with dynamic programming."""
+            counts = count_variants_by_length(containers, volume)
+            return '{}/{}'.format(sum(counts),
+                                  next((count for count in counts if count),
+                                       0))
+        measure('counting', counting)
+
+
+if __name__ == '__main__':
+    main()
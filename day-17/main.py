@@ -59,17 +59,39 @@ def enum_shortest(variants):
     return (variant for variant in variants if len(variant) == optimal_length)
 
 
+def count_variants_by_length(containers, target_volume):
+    """Count container combinations that match the target volume by length.
+
+    Use dynamic programming over a table indexed by volume and number of
+    used containers, adding one container at a time (in reverse volume
+    order, such that every container is used at most once).
+    """
+    counts = [[0] * (len(containers) + 1) for _ in range(target_volume + 1)]
+    counts[0][0] = 1
+
+    for num_seen, size in enumerate(containers, 1):
+        for volume in range(target_volume, size - 1, -1):
+            source = counts[volume - size]
+            target = counts[volume]
+            for length in range(num_seen, 0, -1):
+                target[length] += source[length - 1]
+
+    return counts[target_volume]
+
+
 def main():
     """Main entry point of puzzle solution."""
     EGGNOG_VOLUME = 150
 
     containers = read_input()
 
-    part_one = list(enum_variants(containers, EGGNOG_VOLUME))
-    part_two = list(enum_shortest(part_one))
+    counts = count_variants_by_length(containers, EGGNOG_VOLUME)
+
+    part_one = sum(counts)
+    part_two = next((count for count in counts if count), 0)
 
-    print('Part One: {}'.format(len(part_one)))
-    print('Part Two: {}'.format(len(part_two)))
+    print('Part One: {}'.format(part_one))
+    print('Part Two: {}'.format(part_two))
 
 
 if __name__ == '__main__':
@@ -0,0 +1,73 @@
+"""Advent of Code 2015 - Day 18 (benchmark)."""
+
+import random
+import time
+
+from main import BitmaskLightArray, LightArray, SparseLightArray
+
+
+def random_lines(size, seed=2015):
+    """Generate a square light array with about half of the lights on."""
+    rng = random.Random(seed)
+    return [''.join(rng.choice('#.') for _ in range(size))
+            for _ in range(size)]
+
+
+def sparse_lines(size, num_gliders, seed=2015):
+    """Generate a square light array with randomly scattered gliders."""
+    rng = random.Random(seed)
+    rows = [['.'] * size for _ in range(size)]
+    for _ in range(num_gliders):
+        row, col = rng.randrange(size - 2), rng.randrange(size - 2)
+        for d_row, d_col in [(0, 1), (1, 2), (2, 0), (2, 1), (2, 2)]:
+            rows[row + d_row][col + d_col] = '#'
+    return [''.join(row) for row in rows]
+
+
+def measure(function):
+    """Time a function and return its result along with the elapsed time."""
+    start = time.perf_counter()
+    result = function()
+    return result, time.perf_counter() - start
+
+
+def main():
+    """Compare stepping one light at a time, bitmasks, and sparse sets."""
+    SIZES_AND_STEPS = [(100, 100), (1000, 10), (10000, 100)]
+    SPARSE_SIZES_STEPS_AND_GLIDERS = [(1000, 100, 100), (10000, 100, 100),
+                                      (10000, 100, 10000)]
+    MAX_PER_LIGHT_WORK = 10 ** 7
+
+    print('{:>6} {:>6} {:>12} {:>12} {:>12} {:>12}'.format(
+        'size', 'steps', 'per light', 'time', 'bitmask', 'time'))
+    for size, steps in SIZES_AND_STEPS:
+        lines = random_lines(size)
+
+        if size * size * steps <= MAX_PER_LIGHT_WORK:
+            slow, slow_time = measure(
+                lambda: LightArray(lines, True).step(steps).count_on())
+            slow_time = '{:.3f} s'.format(slow_time)
+        else:
+            slow, slow_time = '-', '-'
+
+        fast, fast_time = measure(
+            lambda: BitmaskLightArray(lines, True).step(steps).count_on())
+        print('{:>6} {:>6} {:>12} {:>12} {:>12} {:>10.3f} s'.format(
+            size, steps, slow, slow_time, fast, fast_time))
+
+    print()
+    print('{:>6} {:>6} {:>8} {:>12} {:>12} {:>12} {:>12}'.format(
+        'size', 'steps', 'gliders', 'bitmask', 'time', 'sparse', 'time'))
+    for size, steps, num_gliders in SPARSE_SIZES_STEPS_AND_GLIDERS:
+        lines = sparse_lines(size, num_gliders)
+
+        dense, dense_time = measure(
+            lambda: BitmaskLightArray(lines, True).step(steps).count_on())
+        sparse, sparse_time = measure(
+            lambda: SparseLightArray(lines, True).step(steps).count_on())
+        print('{:>6} {:>6} {:>8} {:>12} {:>10.3f} s {:>12} {:>10.3f} s'.format(
+            size, steps, num_gliders, dense, dense_time, sparse, sparse_time))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,231 @@
+"""Advent of Code 2015 - Day 18."""
+
+import collections
+import re
+from pathlib import Path
+
+
+def read_input():
+    """Read input file and split into individual lines returned as a list."""
+    lines = Path(__file__).with_name('input.txt').read_text().splitlines()
+    return [line for line in lines if line]
+
+
+class LightArray:
+    """Rectangular light array that is animated like Conway's Game of Life.
+
+    A light stays on if two or three of its eight neighbors are on, and it
+    is turned on if exactly three neighbors are on. Lights beyond the edges
+    count as off. Optionally, the four corner lights are stuck in the on
+    state.
+    """
+
+    def __init__(self, lines, stuck_corners=False):
+        """Initialize light array from lines of '#' (on) and '.' (off)."""
+        self.rows = len(lines)
+        self.cols = len(lines[0]) if lines else 0
+        self.stuck_corners = stuck_corners
+        self.matrix = [[int(char == '#') for char in line] for line in lines]
+        self._fix_corners()
+
+    def corners(self):
+        """Return the coordinates of the corners of the light array."""
+        return {(row, col)
+                for row in {0, self.rows - 1} for col in {0, self.cols - 1}}
+
+    def count_on(self):
+        """Count the lights that are on."""
+        return sum(sum(row) for row in self.matrix)
+
+    def is_on(self, row, col):
+        """Check if the light at the given coordinates is on."""
+        return bool(self.matrix[row][col])
+
+    def step(self, steps=1):
+        """Animate the light array for the given number of steps."""
+        for _ in range(steps):
+            self._step()
+            self._fix_corners()
+
+        return self
+
+    def __str__(self):
+        """Render the light array as lines of '#' (on) and '.' (off)."""
+        return ''.join(''.join('#' if self.is_on(row, col) else '.'
+                               for col in range(self.cols)) + '\n'
+                       for row in range(self.rows))
+
+    def _fix_corners(self):
+        """Turn on the corner lights if they are stuck."""
+        if self.stuck_corners and self.rows and self.cols:
+            for row, col in self.corners():
+                self.matrix[row][col] = 1
+
+    def _step(self):
+        """Animate the light array for a single step, one light at a time."""
+        matrix = self.matrix
+        updated = []
+        for row in range(self.rows):
+            updated_row = []
+            for col in range(self.cols):
+                count = 0
+                for neighbor_row in range(max(row - 1, 0),
+                                          min(row + 2, self.rows)):
+                    for neighbor_col in range(max(col - 1, 0),
+                                              min(col + 2, self.cols)):
+                        count += matrix[neighbor_row][neighbor_col]
+                count -= matrix[row][col]
+                updated_row.append(int(count == 3 or
+                                       count == 2 and matrix[row][col]))
+            updated.append(updated_row)
+
+        self.matrix = updated
+
+
+class BitmaskLightArray(LightArray):
+    """Light array where all lights are packed into a single integer bitmask.
+
+    Rows are stored consecutively with an extra (always off) guard bit, such
+    that shifting by one bit or by one row moves every light onto one of its
+    neighbors. Neighbor counts are then computed bit-parallel for the whole
+    array with a few bit-wise adders.
+    """
+
+    def __init__(self, lines, stuck_corners=False):
+        """Initialize light array from lines of '#' (on) and '.' (off)."""
+        self.rows = len(lines)
+        self.cols = len(lines[0]) if lines else 0
+        self.stuck_corners = stuck_corners
+
+        self.stride = self.cols + 1
+        to_bits = str.maketrans('#.', '10')
+        packed = '0'.join(line.translate(to_bits)[::-1]
+                          for line in reversed(lines))
+        self.board = int(packed or '0', 2)
+
+        self.mask = int(('0' + '1' * self.cols) * self.rows or '0', 2)
+        self.corner_mask = sum(1 << (row * self.stride + col)
+                               for row, col in self.corners())
+        self._fix_corners()
+
+    def count_on(self):
+        """Count the lights that are on."""
+        return bin(self.board).count('1')
+
+    def is_on(self, row, col):
+        """Check if the light at the given coordinates is on."""
+        return bool(self.board >> (row * self.stride + col) & 1)
+
+    def _fix_corners(self):
+        """Turn on the corner lights if they are stuck."""
+        if self.stuck_corners:
+            self.board |= self.corner_mask
+
+    def _step(self):
+        """Animate the light array for a single step, all lights at once."""
+        board = self.board
+        left = board << 1
+        right = board >> 1
+
+        # Add up lights in rows as bit pairs, with and without the center.
+        pair_low = left ^ right
+        pair_high = left & right
+        triple_low = pair_low ^ board
+        triple_high = pair_high | pair_low & board
+
+        # Add up rows above and below the current one as well.
+        above_low = triple_low << self.stride
+        above_high = triple_high << self.stride
+        below_low = triple_low >> self.stride
+        below_high = triple_high >> self.stride
+
+        low = above_low ^ pair_low ^ below_low
+        carry = above_low & pair_low | (above_low ^ pair_low) & below_low
+
+        # A count of two or three has exactly one of the high bits set.
+        exactly_one = ((above_high ^ pair_high ^ below_high ^ carry) &
+                       ~(above_high & pair_high | below_high & carry))
+
+        self.board = exactly_one & (low | board) & self.mask
+
+
+class SparseLightArray(LightArray):
+    """Light array that only tracks the coordinates of lights that are on.
+
+    Every step counts the neighbors of lights that are on, so its cost is
+    proportional to the number of lights that are on instead of the size of
+    the light array. This suits huge, mostly dark light arrays, which may be
+    larger than the given lines or even unbounded.
+    """
+
+    # Offsets from a light to each of its eight neighbors.
+    NEIGHBOR_OFFSETS = [(d_row, d_col)
+                        for d_row in (-1, 0, 1) for d_col in (-1, 0, 1)
+                        if d_row or d_col]
+
+    def __init__(self, lines, stuck_corners=False, shape=None,
+                 unbounded=False):
+        """Initialize light array from lines of '#' (on) and '.' (off).
+
+        The lines are placed at the top left of a light array of the given
+        shape (rows and columns), which defaults to the extent of the lines.
+        Unbounded light arrays have no edges (and hence no stuck corners).
+        """
+        if stuck_corners and unbounded:
+            raise ValueError('Unbounded light arrays have no corners.')
+
+        if shape is None:
+            shape = len(lines), len(lines[0]) if lines else 0
+        self.rows, self.cols = shape
+        self.stuck_corners = stuck_corners
+        self.unbounded = unbounded
+
+        self.lights = {(row, match.start())
+                       for row, line in enumerate(lines)
+                       for match in re.finditer('#', line)}
+        self._fix_corners()
+
+    def count_on(self):
+        """Count the lights that are on."""
+        return len(self.lights)
+
+    def is_on(self, row, col):
+        """Check if the light at the given coordinates is on."""
+        return (row, col) in self.lights
+
+    def _fix_corners(self):
+        """Turn on the corner lights if they are stuck."""
+        if self.stuck_corners and self.rows and self.cols:
+            self.lights |= self.corners()
+
+    def _step(self):
+        """Animate the light array for a single step, sparsely."""
+        lights = self.lights
+        counts = collections.Counter((row + d_row, col + d_col)
+                                     for row, col in lights
+                                     for d_row, d_col in self.NEIGHBOR_OFFSETS)
+
+        updated = {light for light, count in counts.items()
+                   if count == 3 or count == 2 and light in lights}
+        if not self.unbounded:
+            updated = {(row, col) for row, col in updated
+                       if 0 <= row < self.rows and 0 <= col < self.cols}
+
+        self.lights = updated
+
+
+def main():
+    """Main entry point of puzzle solution."""
+    NUM_STEPS = 100
+
+    lines = read_input()
+
+    part_one = BitmaskLightArray(lines)
+    part_two = BitmaskLightArray(lines, stuck_corners=True)
+
+    print('Part One: {}'.format(part_one.step(NUM_STEPS).count_on()))
+    print('Part Two: {}'.format(part_two.step(NUM_STEPS).count_on()))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,39 @@
+"""Advent of Code 2015 - Day 20 (benchmark)."""
+
+import time
+
+from main import find_first_house, find_first_house_sieve
+
+
+def measure(function, *args, **kwargs):
+    """Time a function and return its result along with the elapsed time."""
+    start = time.perf_counter()
+    result = function(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def main():
+    """Compare computing presents house by house against sieving."""
+    MIN_PRESENTS = [10 ** 5, 10 ** 6, 10 ** 7, 34 * 10 ** 6, 10 ** 9]
+    MAX_PER_HOUSE_PRESENTS = 34 * 10 ** 6
+
+    print('{:>12} {:>6} {:>10} {:>12} {:>10} {:>12}'.format(
+        'presents', 'limit', 'per house', 'time', 'sieve', 'time'))
+    for min_presents in MIN_PRESENTS:
+        for per_elf, limit in [(10, None), (11, 50)]:
+            if min_presents <= MAX_PER_HOUSE_PRESENTS:
+                slow, slow_time = measure(find_first_house, per_elf,
+                                          min_presents, limit)
+                slow_time = '{:.3f} s'.format(slow_time)
+            else:
+                slow, slow_time = '-', '-'
+
+            fast, fast_time = measure(find_first_house_sieve, per_elf,
+                                      min_presents, limit)
+            print('{:>12} {:>6} {:>10} {:>12} {:>10} {:>10.3f} s'.format(
+                min_presents, limit or '-', slow, slow_time, fast,
+                fast_time))
+
+
+if __name__ == '__main__':
+    main()
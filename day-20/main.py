@@ -0,0 +1,131 @@
+"""Advent of Code 2015 - Day 20."""
+
+import itertools
+import math
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def sum_of_factors(number):
+    """Compute the sum of all factors of a number from its prime division."""
+    total = 1
+    for prime in itertools.chain([2], itertools.count(3, 2)):
+        if prime * prime > number:
+            break
+        power_sum = 1
+        while number % prime == 0:
+            number //= prime
+            power_sum = power_sum * prime + 1
+        total *= power_sum
+
+    if number > 1:
+        total *= number + 1
+    return total
+
+
+def sum_of_factors_with_limit(number, limit):
+    """Compute the sum of all factors of a number up to a limiting quotient.
+
+    Only factors x of the number such that number / x is at most limit are
+    taken into account, i.e. elves that stop after delivering to a limited
+    number of houses.
+    """
+    return sum(number // quotient for quotient in range(1, limit + 1)
+               if number % quotient == 0)
+
+
+def find_first_house(per_elf, min_presents, limit=None):
+    """Find the first house to get at least a number of presents.
+
+    Presents of every house are computed one house at a time.
+    """
+    for house in range(1, min_presents // per_elf + 2):
+        if limit is None:
+            presents = per_elf * sum_of_factors(house)
+        else:
+            presents = per_elf * sum_of_factors_with_limit(house, limit)
+
+        if presents >= min_presents:
+            return house
+
+    raise RuntimeError('Exhausted search space without finding the house.')
+
+
+def presents_in_range(start, stop, per_elf, limit=None):
+    """Compute presents delivered to every house in a range with a sieve.
+
+    Elves with small numbers visit many houses of the range, so every such
+    elf adds its presents to a strided slice. Elves with large numbers visit
+    at most a few houses of the range, so they are grouped by the ordinal
+    of their visit instead, which makes the elves of every group a range of
+    numbers. Both groups are split at the square root of the range stop.
+    """
+    presents = numpy.zeros(stop - start, dtype=numpy.int64)
+    max_small_elf = int(math.sqrt(stop - 1))
+
+    for elf in range(1, max_small_elf + 1):
+        first = max(elf, -(-start // elf) * elf)
+        last = stop if limit is None else min(stop, elf * limit + 1)
+        if first < last:
+            presents[first - start:last - start:elf] += elf
+
+    max_visits = (stop - 1) // (max_small_elf + 1)
+    if limit is not None:
+        max_visits = min(max_visits, limit)
+    for visits in range(1, max_visits + 1):
+        first_elf = max(max_small_elf + 1, -(-start // visits))
+        last_elf = -(-stop // visits)
+        if first_elf < last_elf:
+            elves = numpy.arange(first_elf, last_elf, dtype=numpy.int64)
+            presents[elves * visits - start] += elves
+
+    return presents * per_elf
+
+
+def find_first_house_sieve(per_elf, min_presents, limit=None,
+                           segment_size=1 << 20):
+    """Find the first house to get at least a number of presents.
+
+    Houses are sieved in consecutive segments, such that memory use is
+    bounded by the segment size. Segments start small and grow up to the
+    given size, so the upper bound of the search is only extended as far as
+    needed. As every elf visits the house with its own number, the house
+    with number min_presents / per_elf is a safe bound for the search.
+    """
+    bound = min_presents // per_elf + 2
+    start = 1
+    size = min(1024, segment_size)
+    while start < bound:
+        stop = min(start + size, bound)
+        presents = presents_in_range(start, stop, per_elf, limit)
+        matches = numpy.flatnonzero(presents >= min_presents)
+        if len(matches):
+            return start + int(matches[0])
+
+        start = stop
+        size = min(2 * size, segment_size)
+
+    raise RuntimeError('Exhausted search space without finding the house.')
+
+
+def main():
+    """Main entry point of puzzle solution."""
+    INPUT_PRESENTS = 34000000
+
+    if numpy is None:
+        find_house = find_first_house
+    else:
+        find_house = find_first_house_sieve
+
+    part_one = find_house(10, INPUT_PRESENTS)
+    part_two = find_house(11, INPUT_PRESENTS, limit=50)
+
+    print('Part One: {}'.format(part_one))
+    print('Part Two: {}'.format(part_two))
+
+
+if __name__ == '__main__':
+    main()